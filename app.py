@@ -10,9 +10,13 @@ Version: 1.0
 """
 
 import os
-import json
+import atexit
 import logging
-from flask import Flask, request, jsonify
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+from xml.sax.saxutils import escape
+from flask import Flask, request
 from twilio.twiml.messaging_response import MessagingResponse
 from datetime import datetime
 
@@ -23,12 +27,18 @@ from twillio_bot import TwilioBot
 from parser import MessageParser
 from commands import CommandHandler
 
-# Configure logging
+# Configure logging; file writes go through a queue so request threads never
+# block on disk I/O
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, logging.FileHandler('job_tracker.log'))
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('job_tracker.log'),
+        QueueHandler(log_queue),
         logging.StreamHandler()
     ]
 )
@@ -38,16 +48,16 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 
 # Load configuration
-with open('config.json', 'r', encoding='utf-8') as f:
-    config = json.load(f)
+with open('config.json', 'rb') as f:
+    config = orjson.loads(f.read())
 
 # Initialize managers
 try:
     sheets_manager = GoogleSheetsManager(config['google_sheets'])
-    scheduler_manager = SchedulerManager()
+    scheduler_manager = SchedulerManager(config, sheets_manager)
     twilio_bot = TwilioBot(config['twilio'])
     message_parser = MessageParser()
-    command_handler = CommandHandler(sheets_manager, scheduler_manager, twilio_bot)
+    command_handler = CommandHandler(sheets_manager, scheduler_manager, twilio_bot, message_parser)
 
     scheduler_manager.start()
     
@@ -56,10 +66,21 @@ except Exception as e:
     logger.error(f"Failed to initialize managers: {e}")
     raise
 
+# Fixed-shape TwiML reply; avoids building and serializing a MessagingResponse tree
+TWIML_TMPL = '<?xml version="1.0" encoding="UTF-8"?><Response><Message>{}</Message></Response>'
+
+def twiml_message(text: str) -> str:
+    """Render a single-message TwiML reply"""
+    return TWIML_TMPL.format(escape(text))
+
+def json_response(payload, status: int = 200):
+    """Serialize payload with orjson into a JSON response"""
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'version': '1.0'
@@ -82,23 +103,19 @@ def webhook():
         from_number = request.values.get('From', '')
         to_number = request.values.get('To', '')
         
-        logger.info(f"Received message from {from_number}: {incoming_msg}")
-        
-        # Create TwiML response
-        resp = MessagingResponse()
+        logger.info("Received message from %s: %s", from_number, incoming_msg)
         
         if not incoming_msg:
-            resp.message("Hello! Send me job application updates like:\n"
-                        "• Amazon (15 Aug) - Applied\n"
-                        "• Google - Not Applied\n"
-                        "Or commands like: Show Applied, Latest Status")
-            return str(resp)
+            return twiml_message("Hello! Send me job application updates like:\n"
+                                 "• Amazon (15 Aug) - Applied\n"
+                                 "• Google - Not Applied\n"
+                                 "Or commands like: Show Applied, Latest Status")
         
         # Extract user identifier (phone number without whatsapp: prefix)
-        user_id = from_number.replace('whatsapp:', '')
+        user_id = from_number.removeprefix('whatsapp:')
         
         # Check if it's a command
-        if message_parser.is_command(incoming_msg):
+        if command_handler.is_command(incoming_msg):
             response_text = command_handler.handle_command(incoming_msg, user_id)
         else:
             # Try to parse as job application update
@@ -110,14 +127,7 @@ def webhook():
                 
                 if result['success']:
                     # Schedule reminders if needed
-                    if parsed_data['status'].lower() == 'applied' and parsed_data.get('date'):
-                        scheduler_manager.schedule_applied_reminder(
-                            user_id, parsed_data['company'], parsed_data['date']
-                        )
-                    elif parsed_data['status'].lower() == 'not applied':
-                        scheduler_manager.schedule_daily_reminder(
-                            user_id, parsed_data['company']
-                        )
+                    command_handler.schedule_reminders(user_id, parsed_data)
                     
                     response_text = f"✅ Updated {parsed_data['company']} - {parsed_data['status']}"
                     if parsed_data.get('date'):
@@ -132,10 +142,9 @@ def webhook():
                                "• Or use commands like 'Show Applied'")
         
         # Send response
-        resp.message(response_text)
-        logger.info(f"Sent response to {from_number}: {response_text}")
+        logger.info("Sent response to %s: %s", from_number, response_text)
         
-        return str(resp)
+        return twiml_message(response_text)
         
     except Exception as e:
         logger.error(f"Error processing webhook: {e}")
@@ -157,17 +166,54 @@ def send_reminder():
         if user_id and message:
             result = twilio_bot.send_message(user_id, message)
             if result['success']:
-                logger.info(f"Reminder sent to {user_id}: {message}")
-                return jsonify({'status': 'success'})
+                logger.info("Reminder sent to %s: %s", user_id, message)
+                return json_response({'status': 'success'})
             else:
                 logger.error(f"Failed to send reminder: {result['error']}")
-                return jsonify({'status': 'error', 'message': result['error']})
+                return json_response({'status': 'error', 'message': result['error']})
         else:
-            return jsonify({'status': 'error', 'message': 'Missing user_id or message'})
+            return json_response({'status': 'error', 'message': 'Missing user_id or message'})
             
     except Exception as e:
         logger.error(f"Error sending reminder: {e}")
-        return jsonify({'status': 'error', 'message': str(e)})
+        return json_response({'status': 'error', 'message': str(e)})
+
+@app.route('/send_reminders_batch', methods=['POST'])
+def send_reminders_batch():
+    """
+    Endpoint for scheduler to send several reminders in one request
+    Expects {"messages": [{"user_id": ..., "message": ...}, ...]}
+    """
+    try:
+        data = request.json or {}
+        messages = data.get('messages') or []
+        
+        # One result per input item, in input order, so the caller can match
+        # them by index; invalid items fail on their own without a send
+        results = [
+            {'user_id': item.get('user_id'), 'success': False, 'error': 'Missing user_id or message'}
+            for item in messages
+        ]
+        valid = [
+            i for i, item in enumerate(messages)
+            if item.get('user_id') and item.get('message')
+        ]
+        
+        sent_results = twilio_bot.send_messages_batch([
+            (messages[i]['user_id'], messages[i]['message']) for i in valid
+        ])
+        for i, result in zip(valid, sent_results):
+            results[i]['success'] = result['success']
+            results[i]['error'] = result.get('error')
+        
+        sent = sum(1 for result in results if result['success'])
+        logger.info("Batch reminders sent: %s/%s", sent, len(results))
+        
+        return json_response({'status': 'success', 'results': results})
+        
+    except Exception as e:
+        logger.error(f"Error sending batch reminders: {e}")
+        return json_response({'status': 'error', 'message': str(e)})
 
 @app.route('/stats', methods=['GET'])
 def get_stats():
@@ -175,14 +221,14 @@ def get_stats():
     try:
         user_id = request.args.get('user_id')
         if not user_id:
-            return jsonify({'error': 'user_id parameter required'}), 400
+            return json_response({'error': 'user_id parameter required'}, 400)
             
         stats = sheets_manager.get_user_stats(user_id)
-        return jsonify(stats)
+        return json_response(stats)
         
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 if __name__ == '__main__':
     # Start the scheduler
@@ -193,7 +239,7 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', config.get('flask', {}).get('port', 5000)))
     host = config.get('flask', {}).get('host', '0.0.0.0')
     
-    logger.info(f"Starting Flask app on {host}:{port}")
+    logger.info("Starting Flask app on %s:%s", host, port)
     
     try:
         app.run(host=host, port=port, debug=debug_mode)
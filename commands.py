@@ -13,16 +13,52 @@ Author: Senior Python Developer
 Version: 1.0
 """
 
+import heapq
 import logging
-from typing import Dict, Any
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
+from parser import MessageParser
+
 logger = logging.getLogger(__name__)
 
+# Descriptions of all user-facing commands
+_ALL_COMMANDS = {
+    'Show Applied': 'Display all jobs you have applied to',
+    'Show Not Applied': 'Display jobs you haven\'t applied to yet',
+    'Show Not Eligible': 'Display jobs you\'re not eligible for',
+    'Show Not Fixed': 'Display jobs with undetermined status',
+    'Latest Status': 'Show your most recent job updates',
+    'Upcoming Applications': 'Show applications due in the next 7 days',
+    'Stats': 'Display your job application statistics',
+    'My Reminders': 'Show all your scheduled reminders',
+    'Delete [Company]': 'Delete a specific company from your list',
+    'Add [Job Info]': 'Add a new job (same format as regular updates)',
+    'Help': 'Show this help message'
+}
+
+# Reply for messages that look like commands but aren't recognized
+_UNKNOWN_COMMAND_TEXT = (
+    "❓ I didn't understand that command.\n\n"
+    "Available commands:\n"
+    "• Show Applied/Not Applied/Not Eligible/Not Fixed\n"
+    "• Latest Status\n"
+    "• Upcoming Applications\n"
+    "• Stats\n"
+    "• My Reminders\n"
+    "• Delete [Company]\n"
+    "• Help\n\n"
+    "Or send job updates like:\n"
+    "• Amazon (15 Aug) - Applied"
+)
+
 class CommandHandler:
     """Handles processing of text commands from WhatsApp messages"""
     
-    def __init__(self, sheets_manager, scheduler_manager, twilio_bot):
+    def __init__(self, sheets_manager, scheduler_manager, twilio_bot, message_parser=None):
         """
         Initialize command handler with required managers
         
@@ -30,10 +66,26 @@ class CommandHandler:
             sheets_manager: GoogleSheetsManager instance
             scheduler_manager: SchedulerManager instance
             twilio_bot: TwilioBot instance
+            message_parser: Optional MessageParser instance (created if not given)
         """
         self.sheets_manager = sheets_manager
         self.scheduler_manager = scheduler_manager
         self.twilio_bot = twilio_bot
+        self._parser = message_parser or MessageParser()
+        
+        # Reminder scheduling keyed on the lower-cased job status
+        self._reminder_dispatch = {
+            'applied': self._schedule_applied_reminder,
+            'not applied': self._schedule_daily_reminder
+        }
+        
+        # The help text never changes, so render it once
+        self._help_text = self.twilio_bot.format_help_message()
+        
+        # Commands come from a tiny vocabulary and repeat constantly, so cache
+        # parse results keyed on the normalized message text
+        self._cached_is_command = lru_cache(maxsize=512)(self._parser.is_command)
+        self._cached_parse_command = lru_cache(maxsize=512)(self._parser.parse_command)
         
         # Map command types to handler methods
         self.command_handlers = {
@@ -50,8 +102,59 @@ class CommandHandler:
             'add': self._handle_add
         }
         
+        # Command usage is counted in memory per (user, command), so analytics
+        # never add a Sheets write to the request path
+        self._usage_counts: Counter = Counter()
+        self._usage_lock = threading.Lock()
+        
         logger.info("Command handler initialized")
     
+    @staticmethod
+    def _normalize_message(message: str) -> str:
+        """Normalize a message into the key used by the parse caches"""
+        return message.strip().lower()
+    
+    def is_command(self, message: str) -> bool:
+        """
+        Check if message is a command, using the cached parser result
+        
+        Args:
+            message: Message to check
+            
+        Returns:
+            True if message is a command
+        """
+        if not message:
+            return False
+        return self._cached_is_command(self._normalize_message(message))
+    
+    def parse_command(self, message: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a command message, using the cached parser result
+        
+        The cache is keyed on the full normalized message, so commands with
+        arguments (e.g. "Delete Google") are cached per argument value.
+        
+        Args:
+            message: Command message
+            
+        Returns:
+            Dictionary with command type and parameters
+        """
+        if not message:
+            return None
+        
+        command_data = self._cached_parse_command(self._normalize_message(message))
+        if not command_data:
+            return None
+        
+        # Return a copy so callers never mutate the cached entry; job_data is
+        # a nested dict, so it gets its own copy too
+        result = dict(command_data, raw_message=message)
+        if 'job_data' in result:
+            result['job_data'] = dict(result['job_data'])
+        return result
+    
     def handle_command(self, message: str, user_id: str) -> str:
         """
         Handle a command message
@@ -64,35 +167,33 @@ class CommandHandler:
             Response message for the user
         """
         try:
-            # Import parser here to avoid circular imports
-            from parser import MessageParser
-            parser = MessageParser()
-            
-            # Parse the command
-            command_data = parser.parse_command(message)
-            
-            if not command_data:
-                return self._handle_unknown_command(message)
-            
-            command_type = command_data['command']
-            
-            # Get the appropriate handler
-            handler = self.command_handlers.get(command_type)
-            if not handler:
-                return self._handle_unknown_command(message)
-            
-            # Execute the command
-            logger.info(f"Executing command '{command_type}' for user {user_id}")
-            return handler(command_data, user_id)
-            
+            return self._dispatch(message, user_id)
         except Exception as e:
             logger.error(f"Error handling command '{message}' for user {user_id}: {e}")
             return "❌ Sorry, something went wrong processing your command. Please try again."
     
+    def _dispatch(self, message: str, user_id: str) -> str:
+        """Parse a command and run its handler; errors propagate to handle_command"""
+        command_data = self.parse_command(message)
+        
+        if not command_data:
+            return self._handle_unknown_command(message)
+        
+        command_type: str = command_data['command']
+        logger.info("Executing command '%s' for user %s", command_type, user_id)
+        with self._usage_lock:
+            self._usage_counts[(user_id, command_type)] += 1
+        
+        handler = self.command_handlers.get(command_type)
+        if handler is None:
+            return self._handle_unknown_command(message)
+        
+        return handler(command_data, user_id)
+    
     def _handle_show_applied(self, command_data: Dict[str, Any], user_id: str) -> str:
         """Handle 'Show Applied' command"""
         try:
-            jobs = self.sheets_manager.get_jobs_by_status(user_id, 'Applied')
+            jobs = self.sheets_manager.iter_jobs(user_id, 'Applied')
             return self.twilio_bot.format_job_list(jobs, "✅ Applied Jobs")
         except Exception as e:
             logger.error(f"Error showing applied jobs: {e}")
@@ -101,7 +202,7 @@ class CommandHandler:
     def _handle_show_not_applied(self, command_data: Dict[str, Any], user_id: str) -> str:
         """Handle 'Show Not Applied' command"""
         try:
-            jobs = self.sheets_manager.get_jobs_by_status(user_id, 'Not Applied')
+            jobs = self.sheets_manager.iter_jobs(user_id, 'Not Applied')
             return self.twilio_bot.format_job_list(jobs, "⏳ Not Applied Jobs")
         except Exception as e:
             logger.error(f"Error showing not applied jobs: {e}")
@@ -110,7 +211,7 @@ class CommandHandler:
     def _handle_show_not_eligible(self, command_data: Dict[str, Any], user_id: str) -> str:
         """Handle 'Show Not Eligible' command"""
         try:
-            jobs = self.sheets_manager.get_jobs_by_status(user_id, 'Not Eligible')
+            jobs = self.sheets_manager.iter_jobs(user_id, 'Not Eligible')
             return self.twilio_bot.format_job_list(jobs, "❌ Not Eligible Jobs")
         except Exception as e:
             logger.error(f"Error showing not eligible jobs: {e}")
@@ -119,7 +220,7 @@ class CommandHandler:
     def _handle_show_not_fixed(self, command_data: Dict[str, Any], user_id: str) -> str:
         """Handle 'Show Not Fixed' command"""
         try:
-            jobs = self.sheets_manager.get_jobs_by_status(user_id, 'Not Fixed')
+            jobs = self.sheets_manager.iter_jobs(user_id, 'Not Fixed')
             return self.twilio_bot.format_job_list(jobs, "🔄 Not Fixed Jobs")
         except Exception as e:
             logger.error(f"Error showing not fixed jobs: {e}")
@@ -128,20 +229,15 @@ class CommandHandler:
     def _handle_latest_status(self, command_data: Dict[str, Any], user_id: str) -> str:
         """Handle 'Latest Status' command"""
         try:
-            all_jobs = self.sheets_manager.get_all_jobs(user_id)
-            
-            if not all_jobs:
-                return "📋 No job applications found. Add some jobs to get started!"
-            
-            # Sort by added date (most recent first)
-            sorted_jobs = sorted(
-                all_jobs, 
-                key=lambda x: x.get('Added Date', ''), 
-                reverse=True
+            # Get the 5 most recent entries by added date (ISO strings sort correctly)
+            recent_jobs = heapq.nlargest(
+                5,
+                self.sheets_manager.iter_jobs(user_id),
+                key=lambda x: x.get('Added Date', '')
             )
             
-            # Get the last 5 entries
-            recent_jobs = sorted_jobs[:5]
+            if not recent_jobs:
+                return "📋 No job applications found. Add some jobs to get started!"
             
             return self.twilio_bot.format_job_list(recent_jobs, "🕒 Latest Job Updates")
             
@@ -169,7 +265,7 @@ class CommandHandler:
     
     def _handle_help(self, command_data: Dict[str, Any], user_id: str) -> str:
         """Handle 'Help' command"""
-        return self.twilio_bot.format_help_message()
+        return self._help_text
     
     def _handle_my_reminders(self, command_data: Dict[str, Any], user_id: str) -> str:
         """Handle 'My Reminders' command"""
@@ -214,14 +310,7 @@ class CommandHandler:
             
             if result['success']:
                 # Schedule reminders if needed
-                if job_data['status'].lower() == 'applied' and job_data.get('date'):
-                    self.scheduler_manager.schedule_applied_reminder(
-                        user_id, job_data['company'], job_data['date']
-                    )
-                elif job_data['status'].lower() == 'not applied':
-                    self.scheduler_manager.schedule_daily_reminder(
-                        user_id, job_data['company']
-                    )
+                self.schedule_reminders(user_id, job_data)
                 
                 response = f"✅ {result['message']}"
                 if job_data.get('date'):
@@ -234,19 +323,33 @@ class CommandHandler:
             logger.error(f"Error adding job: {e}")
             return "❌ Error adding job. Please try again."
     
+    def schedule_reminders(self, user_id: str, job_data: Dict[str, Any]) -> None:
+        """
+        Schedule the reminders that apply to a job's status
+        
+        Args:
+            user_id: User's identifier
+            job_data: Parsed job data from MessageParser
+        """
+        status_lc = job_data.get('status_lc') or job_data['status'].lower()
+        reminder_fn = self._reminder_dispatch.get(status_lc)
+        if reminder_fn:
+            reminder_fn(user_id, job_data)
+    
+    def _schedule_applied_reminder(self, user_id: str, job_data: Dict[str, Any]) -> None:
+        """Schedule a reminder for the application date, if one was given"""
+        if job_data.get('date'):
+            self.scheduler_manager.schedule_applied_reminder(
+                user_id, job_data['company'], job_data['date']
+            )
+    
+    def _schedule_daily_reminder(self, user_id: str, job_data: Dict[str, Any]) -> None:
+        """Schedule the daily "haven't applied yet" reminder"""
+        self.scheduler_manager.schedule_daily_reminder(user_id, job_data['company'])
+    
     def _handle_unknown_command(self, message: str) -> str:
         """Handle unknown or invalid commands"""
-        return (f"❓ I didn't understand that command.\n\n"
-               f"Available commands:\n"
-               f"• Show Applied/Not Applied/Not Eligible/Not Fixed\n"
-               f"• Latest Status\n"
-               f"• Upcoming Applications\n"
-               f"• Stats\n"
-               f"• My Reminders\n"
-               f"• Delete [Company]\n"
-               f"• Help\n\n"
-               f"Or send job updates like:\n"
-               f"• Amazon (15 Aug) - Applied")
+        return _UNKNOWN_COMMAND_TEXT
     
     def get_all_commands(self) -> Dict[str, str]:
         """
@@ -255,19 +358,7 @@ class CommandHandler:
         Returns:
             Dictionary mapping command names to descriptions
         """
-        return {
-            'Show Applied': 'Display all jobs you have applied to',
-            'Show Not Applied': 'Display jobs you haven\'t applied to yet',
-            'Show Not Eligible': 'Display jobs you\'re not eligible for',
-            'Show Not Fixed': 'Display jobs with undetermined status',
-            'Latest Status': 'Show your most recent job updates',
-            'Upcoming Applications': 'Show applications due in the next 7 days',
-            'Stats': 'Display your job application statistics',
-            'My Reminders': 'Show all your scheduled reminders',
-            'Delete [Company]': 'Delete a specific company from your list',
-            'Add [Job Info]': 'Add a new job (same format as regular updates)',
-            'Help': 'Show this help message'
-        }
+        return _ALL_COMMANDS
     
     def search_jobs(self, user_id: str, search_term: str) -> str:
         """
@@ -281,17 +372,17 @@ class CommandHandler:
             Formatted search results
         """
         try:
-            all_jobs = self.sheets_manager.get_all_jobs(user_id)
-            
-            if not all_jobs:
-                return "📋 No jobs found to search through."
-            
-            # Search in company names (case-insensitive)
+            # Search in company names (case-insensitive) while streaming rows
             search_lower = search_term.lower()
-            matching_jobs = [
-                job for job in all_jobs 
-                if search_lower in job.get('Company Name', '').lower()
-            ]
+            has_jobs = False
+            matching_jobs = []
+            for job in self.sheets_manager.iter_jobs(user_id):
+                has_jobs = True
+                if search_lower in str(job.get('Company Name', '')).lower():
+                    matching_jobs.append(job)
+            
+            if not has_jobs:
+                return "📋 No jobs found to search through."
             
             if not matching_jobs:
                 return f"🔍 No jobs found matching '{search_term}'"
@@ -319,22 +410,18 @@ class CommandHandler:
             if not all_jobs:
                 return "📋 No jobs found."
             
-            # Calculate cutoff date
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            cutoff_str = cutoff_date.strftime('%Y-%m-%d')
-            
-            # Filter jobs by added date
+            # Added Date is stored as 'YYYY-MM-DD HH:MM:SS', so comparing the
+            # date prefix as a string orders the same as parsing it. Rows whose
+            # prefix isn't shaped like a date are skipped, and the cutoff day
+            # itself is excluded (its midnight is before the cutoff time).
+            cutoff_str = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
             recent_jobs = []
             for job in all_jobs:
-                added_date_str = job.get('Added Date', '')
-                if added_date_str:
-                    try:
-                        # Parse added date (assuming YYYY-MM-DD HH:MM:SS format)
-                        added_date = datetime.strptime(added_date_str[:10], '%Y-%m-%d')
-                        if added_date >= cutoff_date:
-                            recent_jobs.append(job)
-                    except ValueError:
-                        continue
+                added_date = str(job.get('Added Date', ''))[:10]
+                if (len(added_date) == 10 and added_date[4] == added_date[7] == '-'
+                        and (added_date[:4] + added_date[5:7] + added_date[8:]).isdigit()
+                        and added_date > cutoff_str):
+                    recent_jobs.append(job)
             
             if not recent_jobs:
                 return f"📋 No jobs added in the last {days_back} days."
@@ -381,11 +468,15 @@ class CommandHandler:
         Returns:
             Dictionary with usage statistics
         """
-        # This would typically track command usage in a database
-        # For now, return basic info about available commands
+        # Counts cover this worker process since it started
+        with self._usage_lock:
+            usage = {command: count for (uid, command), count in self._usage_counts.items()
+                     if uid == user_id}
+        
         return {
             'total_commands': len(self.command_handlers),
             'available_commands': list(self.command_handlers.keys()),
+            'command_usage': usage,
             'user_id': user_id,
             'last_updated': datetime.now().isoformat()
         }
\ No newline at end of file
@@ -12,17 +12,122 @@ Author: Senior Python Developer
 Version: 1.0
 """
 
+import calendar
 import logging
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
 import gspread
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Month names and abbreviations ("aug", "august") -> month number
+_MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
+_MONTHS.update({name.lower(): i for i, name in enumerate(calendar.month_name) if name})
+
+# Application Date formats: "15 Aug" / "15 August", "2024-08-15", "15/08/2024"
+_APP_DATE_RE = re.compile(
+    r'^(?:(\d{1,2})\s+([A-Za-z]+)'
+    r'|(\d{4})-(\d{1,2})-(\d{1,2})'
+    r'|(\d{1,2})/(\d{1,2})/(\d{4}))$'
+)
+
+# A job record paired with its parsed (year, month, day) Application Date
+_DatedJob = Tuple[Tuple[Optional[int], int, int], Dict[str, Any]]
+
+@lru_cache(maxsize=1024)
+def _parse_app_date(date_str: str) -> Optional[Tuple[Optional[int], int, int]]:
+    """
+    Parse an Application Date string without strptime
+    
+    Args:
+        date_str: Stored date string
+        
+    Returns:
+        (year, month, day) with year None when the string has no year, or None if invalid
+    """
+    match = _APP_DATE_RE.match(date_str)
+    if not match:
+        return None
+    
+    day_mon, mon_name, iso_y, iso_m, iso_d, dmy_d, dmy_m, dmy_y = match.groups()
+    if day_mon:
+        month = _MONTHS.get(mon_name.lower())
+        if not month:
+            return None
+        year, day = None, int(day_mon)
+    elif iso_y:
+        year, month, day = int(iso_y), int(iso_m), int(iso_d)
+    else:
+        year, month, day = int(dmy_y), int(dmy_m), int(dmy_d)
+    
+    # Reject impossible dates (validated against a leap year when the year is unknown)
+    try:
+        datetime(year or 2000, month, day)
+    except ValueError:
+        return None
+    return year, month, day
+
+@lru_cache(maxsize=None)
+def _load_credentials(credentials_file: str, scopes: Tuple[str, ...]) -> Credentials:
+    """Parse a service account key file once per process"""
+    return Credentials.from_service_account_file(credentials_file, scopes=list(scopes))
+
+class _RetryingClient(gspread.Client):
+    """gspread client that retries rate-limited and transient server errors"""
+    
+    # Reads are retried on any transient error. A write (append, batchUpdate,
+    # addSheet) may already be applied when a 500/502/504 comes back, so it is
+    # only retried on responses that mean it was not: 429 and 503.
+    _RETRY_STATUS_READ = frozenset({429, 500, 502, 503, 504})
+    _RETRY_STATUS_WRITE = frozenset({429, 503})
+    _TRIES = 5           # attempts in total, including the first
+    _BASE_DELAY = 0.5    # seconds, doubled per retry
+    _MAX_DELAY = 4.0     # cap for a single wait, including Retry-After
+    _JITTER = 0.3        # random extra seconds so concurrent retries spread out
+    
+    # Total seconds one call may spend waiting between attempts. Webhook
+    # handlers make a couple of Sheets calls and Twilio gives up after 15s,
+    # so a call that can't succeed within this fails fast instead.
+    _RETRY_BUDGET = 5.0
+    
+    def request(self, method, *args, **kwargs):
+        retry_status = self._RETRY_STATUS_READ if method.lower() == 'get' else self._RETRY_STATUS_WRITE
+        deadline = time.monotonic() + self._RETRY_BUDGET
+        for attempt in range(self._TRIES):
+            try:
+                return super().request(method, *args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                status = e.response.status_code
+                remaining = deadline - time.monotonic()
+                if status not in retry_status or attempt == self._TRIES - 1 or remaining <= 0:
+                    raise
+                delay = min(remaining, self._retry_delay(e.response, attempt))
+                logger.warning(f"Sheets API returned {status}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def _retry_delay(self, response, attempt: int) -> float:
+        """Seconds to wait before the next attempt, honoring Retry-After"""
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(self._MAX_DELAY, float(retry_after))
+        return min(self._MAX_DELAY, self._BASE_DELAY * 2 ** attempt) + random.random() * self._JITTER
+
 class GoogleSheetsManager:
     """Manages Google Sheets operations for job application tracking"""
     
+    # user_id -> sheet name: drop '+', map '-' to '_', and strip characters
+    # that are not allowed in sheet titles
+    _SHEET_NAME_TABLE = str.maketrans({'+': None, '-': '_', **dict.fromkeys('[]*?:/\\')})
+    _MAX_SHEET_NAME = 100
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Google Sheets manager
@@ -43,18 +148,69 @@ class GoogleSheetsManager:
         # Column headers for the job tracking sheet
         self.headers = ['Company Name', 'Status', 'Application Date', 'Added Date', 'Notes']
         
-        # Initialize Google Sheets client
-        self._init_client()
+        # Column headers for the shared reminders sheet (see SchedulerManager)
+        self.reminder_headers = [
+            'Reminder ID', 'User ID', 'Company', 'Reminder Type',
+            'Trigger Time', 'Message', 'Status', 'Created Date'
+        ]
+        
+        # Worksheet handles by title, filled at startup and on first use
+        self._ws_cache: Dict[str, gspread.Worksheet] = {}
+        
+        # Per-user cache of job records: user_id -> (fetched_at, records, by_status, dated)
+        # where by_status groups the same records under their casefolded status and
+        # dated pairs each record that has a valid Application Date with its parse
+        self._jobs_cache: Dict[str, Tuple[float, List[Dict[str, Any]],
+                                          Dict[str, List[Dict[str, Any]]],
+                                          List[_DatedJob]]] = {}
+        self._jobs_cache_ttl = config.get('cache_ttl_seconds', 60)
+        self._jobs_lock = threading.Lock()
+        
+        # Per-user locks that make find-then-write sequences atomic in-process
+        self._user_locks: Dict[str, threading.Lock] = {}
+        
+        # Per-user write counter, and the stats computed from a jobs cache
+        # entry keyed by that entry's fetched_at
+        self._user_etag: Dict[str, int] = defaultdict(int)
+        self._stats_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # Google Sheets client, created on first use by _ensure_client
+        self._client: Optional[gspread.Client] = None
+        self._spreadsheet: Optional[gspread.Spreadsheet] = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def client(self) -> gspread.Client:
+        """Authorized gspread client (initialized on first access)"""
+        self._ensure_client()
+        return self._client
+    
+    @property
+    def spreadsheet(self) -> gspread.Spreadsheet:
+        """The tracker spreadsheet (opened on first access)"""
+        self._ensure_client()
+        return self._spreadsheet
+    
+    def _ensure_client(self):
+        """Initialize the client once, even when several threads race to use it"""
+        if self._spreadsheet is None:
+            with self._client_lock:
+                if self._spreadsheet is None:
+                    self._init_client()
     
     def _init_client(self):
         """Initialize the Google Sheets client with service account credentials"""
         try:
-            credentials = Credentials.from_service_account_file(
-                self.credentials_file, 
-                scopes=self.scope
-            )
-            self.client = gspread.authorize(credentials)
-            self.spreadsheet = self.client.open_by_key(self.spreadsheet_id)
+            credentials = _load_credentials(self.credentials_file, tuple(self.scope))
+            client = gspread.authorize(credentials, client_factory=_RetryingClient)
+            # All calls share the client's session; size its pool so concurrent
+            # request threads reuse warm TLS connections instead of opening new ones
+            client.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+            spreadsheet = client.open_by_key(self.spreadsheet_id)
+            # One metadata request up front makes later "exists?" probes local
+            self._ws_cache = {ws.title: ws for ws in spreadsheet.worksheets()}
+            self._client = client
+            self._spreadsheet = spreadsheet
             logger.info("Google Sheets client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Google Sheets client: {e}")
@@ -71,25 +227,148 @@ class GoogleSheetsManager:
             gspread.Worksheet: The user's worksheet
         """
         # Clean user_id to be a valid sheet name
-        sheet_name = f"User_{user_id.replace('+', '').replace('-', '_')}"
+        sheet_name = f"User_{user_id.translate(self._SHEET_NAME_TABLE)}"[:self._MAX_SHEET_NAME]
+        return self._get_or_create_named_worksheet(sheet_name, self.headers, cols=10)
+    
+    def _get_or_create_named_worksheet(self, sheet_name: str, headers: List[str],
+                                       cols: int) -> gspread.Worksheet:
+        """
+        Get a worksheet by title from the handle cache, creating it if needed
+        
+        Args:
+            sheet_name: Worksheet title
+            headers: Header row written when the worksheet is created
+            cols: Column count for a new worksheet
+            
+        Returns:
+            gspread.Worksheet: The cached or newly created worksheet
+        """
+        # Opening the spreadsheet seeds the handle cache
+        self._ensure_client()
+        worksheet = self._ws_cache.get(sheet_name)
+        if worksheet is not None:
+            return worksheet
         
         try:
-            # Try to get existing worksheet
+            # Another process may have created it since startup
             worksheet = self.spreadsheet.worksheet(sheet_name)
             logger.info(f"Found existing worksheet: {sheet_name}")
         except gspread.WorksheetNotFound:
-            # Create new worksheet
-            worksheet = self.spreadsheet.add_worksheet(
-                title=sheet_name, 
-                rows=1000, 
-                cols=10
-            )
-            # Add headers
-            worksheet.append_row(self.headers)
+            # Create new worksheet with its headers
+            worksheet = self._add_worksheet_with_headers(sheet_name, headers, cols)
             logger.info(f"Created new worksheet: {sheet_name}")
         
+        self._ws_cache[sheet_name] = worksheet
         return worksheet
     
+    def get_reminders_worksheet(self) -> gspread.Worksheet:
+        """
+        Get or create the shared Reminders worksheet
+        
+        Returns:
+            gspread.Worksheet: The cached or newly created Reminders worksheet
+        """
+        return self._get_or_create_named_worksheet("Reminders", self.reminder_headers, cols=8)
+    
+    def _add_worksheet_with_headers(self, sheet_name: str, headers: List[str],
+                                    cols: int) -> gspread.Worksheet:
+        """
+        Create a worksheet and write its header row in a single batchUpdate
+        
+        Args:
+            sheet_name: Worksheet title
+            headers: Header row values
+            cols: Column count for the new worksheet
+            
+        Returns:
+            gspread.Worksheet: The new worksheet
+        """
+        # Choose the sheet ID up front so updateCells can target the sheet
+        # that addSheet creates within the same request
+        taken_ids = {ws.id for ws in self._ws_cache.values()}
+        sheet_id = random.randrange(1, 2**31 - 1)
+        while sheet_id in taken_ids:
+            sheet_id = random.randrange(1, 2**31 - 1)
+        
+        response = self.spreadsheet.batch_update({'requests': [
+            {'addSheet': {'properties': {
+                'sheetId': sheet_id,
+                'title': sheet_name,
+                'gridProperties': {'rowCount': 1000, 'columnCount': cols}
+            }}},
+            {'updateCells': {
+                'rows': [{'values': [{'userEnteredValue': {'stringValue': h}} for h in headers]}],
+                'fields': 'userEnteredValue',
+                'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': 0}
+            }}
+        ]})
+        
+        properties = response['replies'][0]['addSheet']['properties']
+        return gspread.Worksheet(self.spreadsheet, properties)
+    
+    def _get_jobs_entry(self, user_id: str) -> Tuple[float, List[Dict[str, Any]],
+                                                     Dict[str, List[Dict[str, Any]]],
+                                                     List[_DatedJob]]:
+        """
+        Get a user's jobs cache entry, reading their sheet when it is stale
+        
+        Args:
+            user_id: User's identifier
+            
+        Returns:
+            (fetched_at, records, records by casefolded status, dated records)
+        """
+        with self._jobs_lock:
+            cached = self._jobs_cache.get(user_id)
+            if cached and time.monotonic() - cached[0] < self._jobs_cache_ttl:
+                return cached
+            generation = self._user_etag[user_id]
+        
+        worksheet = self._get_or_create_worksheet(user_id)
+        records = worksheet.get_all_records()
+        
+        # Normalize each status and parse each date once per fetch rather
+        # than on every filter
+        by_status: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        dated = []
+        for job in records:
+            by_status[str(job.get('Status', '')).casefold()].append(job)
+            app_date_str = str(job.get('Application Date', '')).strip()
+            parsed = _parse_app_date(app_date_str) if app_date_str else None
+            if parsed:
+                dated.append((parsed, job))
+        
+        entry = (time.monotonic(), records, dict(by_status), dated)
+        
+        # A write that landed during the read bumped the etag; don't cache
+        # what may be the pre-write rows
+        with self._jobs_lock:
+            if generation == self._user_etag[user_id]:
+                self._jobs_cache[user_id] = entry
+        return entry
+    
+    def _get_cached_jobs(self, user_id: str) -> List[Dict[str, Any]]:
+        """Get a user's job records, served from a short-lived cache when fresh"""
+        return self._get_jobs_entry(user_id)[1]
+    
+    def _get_jobs_by_status_index(self, user_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Get a user's cached records grouped by casefolded status"""
+        return self._get_jobs_entry(user_id)[2]
+    
+    def _get_dated_jobs(self, user_id: str) -> List[_DatedJob]:
+        """Get a user's cached records that have a parsable Application Date"""
+        return self._get_jobs_entry(user_id)[3]
+    
+    def _invalidate_jobs_cache(self, user_id: str):
+        """Drop a user's cached job records and bump their etag after a write"""
+        with self._jobs_lock:
+            self._jobs_cache.pop(user_id, None)
+            self._user_etag[user_id] += 1
+    
+    def _user_lock(self, user_id: str) -> threading.Lock:
+        """Get the lock that serializes a user's row lookups and writes"""
+        return self._user_locks.setdefault(user_id, threading.Lock())
+    
     def add_or_update_job(self, user_id: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Add a new job application or update existing one
@@ -109,37 +388,44 @@ class GoogleSheetsManager:
             app_date = job_data.get('date', '')
             notes = job_data.get('notes', '')
             
-            # Check if company already exists
-            existing_row = self._find_company_row(worksheet, company)
-            
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            if existing_row:
-                # Update existing entry
-                row_num = existing_row['row']
-                worksheet.update(f'B{row_num}', status)  # Status
-                worksheet.update(f'C{row_num}', app_date)  # Application Date
-                worksheet.update(f'D{row_num}', current_time)  # Updated Date
-                if notes:
-                    worksheet.update(f'E{row_num}', notes)  # Notes
+            # Lookup and write must not interleave with another write for this user
+            with self._user_lock(user_id):
+                # Check if company already exists
+                existing_row = self._find_company_row(worksheet, company)
                 
-                logger.info(f"Updated {company} for user {user_id}")
-                return {
-                    'success': True, 
-                    'message': f'Updated {company}',
-                    'action': 'updated'
-                }
-            else:
-                # Add new entry
-                new_row = [company, status, app_date, current_time, notes]
-                worksheet.append_row(new_row)
+                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 
-                logger.info(f"Added {company} for user {user_id}")
-                return {
-                    'success': True, 
-                    'message': f'Added {company}',
-                    'action': 'added'
-                }
+                if existing_row:
+                    # Update existing entry
+                    row_num = existing_row['row']
+                    row_data = existing_row['data']
+                    existing_notes = row_data[4] if len(row_data) > 4 else ''
+                    
+                    # Status, Application Date, Updated Date and Notes in one request
+                    worksheet.batch_update([{
+                        'range': f'B{row_num}:E{row_num}',
+                        'values': [[status, app_date or '', current_time, notes or existing_notes]]
+                    }])
+                    self._invalidate_jobs_cache(user_id)
+                    
+                    logger.info(f"Updated {company} for user {user_id}")
+                    return {
+                        'success': True, 
+                        'message': f'Updated {company}',
+                        'action': 'updated'
+                    }
+                else:
+                    # Add new entry
+                    new_row = [company, status, app_date, current_time, notes]
+                    worksheet.append_row(new_row)
+                    self._invalidate_jobs_cache(user_id)
+                    
+                    logger.info(f"Added {company} for user {user_id}")
+                    return {
+                        'success': True, 
+                        'message': f'Added {company}',
+                        'action': 'added'
+                    }
                 
         except Exception as e:
             logger.error(f"Error adding/updating job for user {user_id}: {e}")
@@ -160,16 +446,16 @@ class GoogleSheetsManager:
             Dictionary with row info or None if not found
         """
         try:
-            # Get all values in the first column (Company Name)
-            companies = worksheet.col_values(1)
+            # One request returns both the company column and the row payload
+            rows = worksheet.get_all_values()
             
-            # Search for the company (case-insensitive)
-            for i, comp in enumerate(companies):
-                if comp.lower() == company.lower():
+            # Search for the company (case-insensitive), skipping the header row
+            target = company.casefold()
+            for row_num, row_data in enumerate(rows[1:], start=2):
+                if row_data and row_data[0].casefold() == target:
                     # Return row number (1-indexed) and row data
-                    row_data = worksheet.row_values(i + 1)
                     return {
-                        'row': i + 1,
+                        'row': row_num,
                         'data': row_data
                     }
             return None
@@ -190,16 +476,9 @@ class GoogleSheetsManager:
             List of job dictionaries
         """
         try:
-            worksheet = self._get_or_create_worksheet(user_id)
-            
-            # Get all records
-            records = worksheet.get_all_records()
-            
-            # Filter by status (case-insensitive)
-            filtered_jobs = [
-                job for job in records 
-                if job['Status'].lower() == status.lower()
-            ]
+            # Look up the status (case-insensitive) in the grouped records
+            by_status = self._get_jobs_by_status_index(user_id)
+            filtered_jobs = list(by_status.get(status.casefold(), []))
             
             logger.info(f"Found {len(filtered_jobs)} jobs with status '{status}' for user {user_id}")
             return filtered_jobs
@@ -219,16 +498,37 @@ class GoogleSheetsManager:
             List of all job dictionaries
         """
         try:
-            worksheet = self._get_or_create_worksheet(user_id)
-            records = worksheet.get_all_records()
+            records = self._get_cached_jobs(user_id)
             
             logger.info(f"Retrieved {len(records)} jobs for user {user_id}")
-            return records
+            return list(records)
             
         except Exception as e:
             logger.error(f"Error getting all jobs for user {user_id}: {e}")
             return []
     
+    def iter_jobs(self, user_id: str, status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a user's jobs, optionally filtered by status
+        
+        Args:
+            user_id: User's identifier
+            status: Optional status to filter by (case-insensitive)
+            
+        Yields:
+            Job dictionaries
+        """
+        try:
+            if status:
+                jobs = self._get_jobs_by_status_index(user_id).get(status.casefold(), [])
+            else:
+                jobs = self._get_cached_jobs(user_id)
+        except Exception as e:
+            logger.error(f"Error iterating jobs for user {user_id}: {e}")
+            return
+        
+        yield from jobs
+    
     def delete_job(self, user_id: str, company: str) -> Dict[str, Any]:
         """
         Delete a job entry
@@ -243,23 +543,26 @@ class GoogleSheetsManager:
         try:
             worksheet = self._get_or_create_worksheet(user_id)
             
-            # Find the company row
-            existing_row = self._find_company_row(worksheet, company)
-            
-            if existing_row:
-                # Delete the row
-                worksheet.delete_rows(existing_row['row'])
+            # Lookup and delete must not interleave with another write for this user
+            with self._user_lock(user_id):
+                # Find the company row
+                existing_row = self._find_company_row(worksheet, company)
                 
-                logger.info(f"Deleted {company} for user {user_id}")
-                return {
-                    'success': True,
-                    'message': f'Deleted {company}'
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': f'Company {company} not found'
-                }
+                if existing_row:
+                    # Delete the row
+                    worksheet.delete_rows(existing_row['row'])
+                    self._invalidate_jobs_cache(user_id)
+                    
+                    logger.info(f"Deleted {company} for user {user_id}")
+                    return {
+                        'success': True,
+                        'message': f'Deleted {company}'
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'error': f'Company {company} not found'
+                    }
                 
         except Exception as e:
             logger.error(f"Error deleting job for user {user_id}: {e}")
@@ -280,32 +583,20 @@ class GoogleSheetsManager:
             List of upcoming applications
         """
         try:
-            worksheet = self._get_or_create_worksheet(user_id)
-            records = worksheet.get_all_records()
-            
             upcoming = []
             today = datetime.now()
             cutoff_date = today + timedelta(days=days_ahead)
             
-            for job in records:
-                app_date_str = job.get('Application Date', '').strip()
-                if app_date_str:
-                    try:
-                        # Try different date formats
-                        for date_format in ['%d %b', '%d %B', '%Y-%m-%d', '%d/%m/%Y']:
-                            try:
-                                app_date = datetime.strptime(app_date_str, date_format)
-                                # If no year specified, assume current year
-                                if app_date.year == 1900:
-                                    app_date = app_date.replace(year=today.year)
-                                
-                                if today <= app_date <= cutoff_date:
-                                    upcoming.append(job)
-                                break
-                            except ValueError:
-                                continue
-                    except Exception:
-                        continue
+            # Only records with a valid date, already parsed at fetch time
+            for (year, month, day), job in self._get_dated_jobs(user_id):
+                try:
+                    # If no year specified, assume current year
+                    app_date = datetime(year or today.year, month, day)
+                except ValueError:
+                    continue  # 29 Feb without a year outside a leap year
+                
+                if today <= app_date <= cutoff_date:
+                    upcoming.append(job)
             
             logger.info(f"Found {len(upcoming)} upcoming applications for user {user_id}")
             return upcoming
@@ -325,8 +616,12 @@ class GoogleSheetsManager:
             Dictionary with various statistics
         """
         try:
-            worksheet = self._get_or_create_worksheet(user_id)
-            records = worksheet.get_all_records()
+            # Stats only change when the jobs cache entry does: a write drops
+            # the entry and a TTL expiry refetches it, both with a new fetched_at
+            fetched_at, records, by_status, _ = self._get_jobs_entry(user_id)
+            cached = self._stats_cache.get(user_id)
+            if cached and cached[0] == fetched_at:
+                return cached[1]
             
             stats = {
                 'total_applications': len(records),
@@ -337,21 +632,16 @@ class GoogleSheetsManager:
                 'recent_activity': []
             }
             
-            # Count by status
-            for job in records:
-                status = job['Status'].lower()
-                if status == 'applied':
-                    stats['applied'] += 1
-                elif status == 'not applied':
-                    stats['not_applied'] += 1
-                elif status == 'not eligible':
-                    stats['not_eligible'] += 1
-                elif status == 'not fixed':
-                    stats['not_fixed'] += 1
+            # Count by status from the records already grouped at fetch time
+            stats['applied'] = len(by_status.get('applied', []))
+            stats['not_applied'] = len(by_status.get('not applied', []))
+            stats['not_eligible'] = len(by_status.get('not eligible', []))
+            stats['not_fixed'] = len(by_status.get('not fixed', []))
             
             # Get recent activity (last 5 entries)
-            stats['recent_activity'] = records[-5:] if len(records) > 5 else records
+            stats['recent_activity'] = records[-5:]
             
+            self._stats_cache[user_id] = (fetched_at, stats)
             return stats
             
         except Exception as e:
@@ -363,4 +653,4 @@ class GoogleSheetsManager:
                 'not_eligible': 0,
                 'not_fixed': 0,
                 'recent_activity': []
-            }
\ No newline at end of file
+            }
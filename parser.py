@@ -17,10 +17,225 @@ Version: 1.0
 import re
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, Any, List
 
 logger = logging.getLogger(__name__)
 
+# Command patterns, matched against the lower-cased message
+_COMMAND_PATTERNS = {
+    'show_applied': re.compile(r'^show\s+applied$'),
+    'show_not_applied': re.compile(r'^show\s+not\s+applied$'),
+    'show_not_eligible': re.compile(r'^show\s+not\s+eligible$'),
+    'show_not_fixed': re.compile(r'^show\s+not\s+fixed$'),
+    'latest_status': re.compile(r'^latest\s+status$'),
+    'upcoming': re.compile(r'^upcoming\s+(applications?)?$'),
+    'stats': re.compile(r'^stats?$'),
+    'help': re.compile(r'^help$'),
+    'my_reminders': re.compile(r'^(my\s+)?reminders?$'),
+    'delete': re.compile(r'^delete\s+(?P<delete_arg>.+)$'),
+    'add': re.compile(r'^add\s+(?P<add_arg>.+)$')
+}
+
+# All command patterns fused into one alternation; the matching command is
+# the name of the outermost group (match.lastgroup)
+_COMMAND_RE = re.compile('|'.join(
+    f'(?P<{command_type}>{pattern.pattern[1:-1]})'
+    for command_type, pattern in _COMMAND_PATTERNS.items()
+))
+
+# Job update patterns: Company Name (optional date) - Status. They contain no
+# letters, so they need no IGNORECASE and run on the original-case message
+_JOB_PATTERNS = [
+    # Company (Date) - Status
+    re.compile(r'^([^()]+?)\s*\(([^)]+)\)\s*-\s*(.+)$'),
+    # Company - Status (no date)
+    re.compile(r'^([^-]+?)\s*-\s*(.+)$')
+]
+
+# Date patterns to recognize
+_DATE_PATTERNS = [
+    re.compile(r'\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)', re.IGNORECASE),
+    re.compile(r'\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)', re.IGNORECASE),
+    re.compile(r'\d{4}-\d{2}-\d{2}'),  # YYYY-MM-DD
+    re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),  # DD/MM/YYYY
+    re.compile(r'\d{1,2}-\d{1,2}-\d{4}')   # DD-MM-YYYY
+]
+
+# Any of the date patterns, for a single search per text
+_DATE_ANY_RE = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in _DATE_PATTERNS), re.IGNORECASE)
+
+# Common company suffixes and prefixes to help identify companies
+_COMPANY_INDICATORS = re.compile(
+    r'\b(\w+\s+(?:inc|corp|ltd|llc|company|technologies|tech|systems|solutions|group|enterprises'
+    r'|labs|studios|ventures|capital|partners|consulting|services)'
+    r'|google|amazon|microsoft|apple|facebook|meta|netflix|uber|airbnb|tesla|spacex)\b',
+    re.IGNORECASE
+)
+
+# Status aliases and variations, keyed by normalized status. This one table
+# backs status normalization, free-form fallback parsing and
+# get_status_variations, so they cannot drift apart.
+_STATUS_VARIATIONS = {
+    'Applied': ('applied', 'submitted', 'sent', 'done', 'complete'),
+    'Not Applied': ('not applied', 'pending', 'todo', 'to do', 'not done', 'not submitted'),
+    'Not Eligible': ('not eligible', 'ineligible', 'rejected', 'not qualified', 'no match'),
+    'Not Fixed': ('not fixed', 'uncertain', 'maybe', 'considering', 'thinking', 'undecided')
+}
+
+# Valid job application statuses (lower-cased) and a one-pass search for any
+# of them inside a message
+_VALID_STATUSES = tuple(status.lower() for status in _STATUS_VARIATIONS)
+
+# Lower-cased form of each canonical status, built once so parsed results share
+# the same string objects instead of allocating new ones per message
+_STATUS_LOWER = dict(zip(_STATUS_VARIATIONS, _VALID_STATUSES))
+_VALID_STATUS_RE = re.compile('|'.join(map(re.escape, _VALID_STATUSES)))
+
+# Common typos, keyed by normalized status
+_FUZZY_STATUS_MATCHES = {
+    'Applied': ('aplied', 'applyed', 'apllied'),
+    'Not Applied': ('not aplied', 'not applyed', 'notapplied'),
+    'Not Eligible': ('not eligable', 'noteligible', 'not elligible'),
+    'Not Fixed': ('not fixd', 'notfixed', 'not fixxed')
+}
+
+# Status keyword search for free-form messages in priority order: exact
+# statuses first, then the aliases. Each branch is a lookahead over the whole
+# message and branches are tried in order, so a single match call picks the
+# first status in that order with a keyword anywhere in the message.
+_FALLBACK_STATUS_ORDER = [
+    *((status, [status.lower()]) for status in _STATUS_VARIATIONS),
+    *_STATUS_VARIATIONS.items()
+]
+_FALLBACK_STATUS_RE = re.compile(
+    '|'.join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, aliases))}))(?P<s{i}>)"
+        for i, (_, aliases) in enumerate(_FALLBACK_STATUS_ORDER)
+    ),
+    re.DOTALL
+)
+_FALLBACK_STATUS_BY_GROUP = {f's{i}': status for i, (status, _) in enumerate(_FALLBACK_STATUS_ORDER)}
+
+# Flat lookup: any lower-cased alias or typo -> normalized status
+_STATUS_LOOKUP = {
+    alias: status
+    for table in (_FUZZY_STATUS_MATCHES, _STATUS_VARIATIONS)
+    for status, aliases in table.items()
+    for alias in aliases
+}
+
+# Cleanup patterns for company names
+_TRAILING_SEPARATOR = re.compile(r'\s*[-–—]\s*$')
+_TRAILING_PAREN = re.compile(r'\s*[()]\s*$')
+
+# English month names for the "15 Aug" / "15 August" fast path
+_MONTH_ABBRS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+_MONTH_NAMES = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+                'august', 'september', 'october', 'november', 'december']
+_MONTHS = {name: i for i, name in enumerate(_MONTH_NAMES)}
+_MONTHS.update({abbr.lower(): i for i, abbr in enumerate(_MONTH_ABBRS)})
+
+# Days per month without a year; 29 Feb is rejected, as strptime does
+_MONTH_DAYS = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+def _format_day_month(date_str: str) -> Optional[str]:
+    """
+    Format a "15 Aug" / "15 August" string as "15 Aug" without strptime
+    
+    Args:
+        date_str: Stripped date string with a day and a month name
+        
+    Returns:
+        Formatted date string or None if it is not a valid day and month
+    """
+    day_str, month_str = date_str.split()
+    month = _MONTHS.get(month_str.lower())
+    if month is None or not (day_str.isascii() and day_str.isdigit()) or len(day_str) > 2:
+        return None
+    
+    day = int(day_str)
+    if not 1 <= day <= _MONTH_DAYS[month]:
+        return None
+    return f"{day:02d} {_MONTH_ABBRS[month]}"
+
+def _date_format_for(date_str: str) -> Optional[str]:
+    """
+    Pick the strptime format from the shape of a date string
+    
+    Args:
+        date_str: Stripped date string
+        
+    Returns:
+        The single format worth trying, or None if the shape is unrecognized
+    """
+    if date_str[:4].isdigit() and date_str[4:5] == '-':
+        return '%Y-%m-%d'      # "2024-08-15"
+    if '/' in date_str:
+        return '%d/%m/%Y'      # "15/08/2024"
+    if '-' in date_str:
+        return '%d-%m-%Y'      # "15-08-2024"
+    
+    tokens = date_str.split()
+    if len(tokens) == 2 and tokens[1].isalpha():
+        # "15 Aug" vs "15 August" ("May" is both and parses with %b)
+        return '%d %b' if len(tokens[1]) == 3 else '%d %B'
+    return None
+
+@lru_cache(maxsize=2048)
+def _parse_date(date_str: str) -> Optional[str]:
+    """
+    Parse a stripped date string into the stored "15 Aug" form
+    
+    Dates repeat constantly across updates, so results are memoized; the
+    output never includes the year, so cached values stay valid across years.
+    
+    Args:
+        date_str: Stripped date string
+        
+    Returns:
+        Formatted date string or None if invalid
+    """
+    # Common date formats, all written back as "15 Aug"
+    date_formats = [
+        '%d %b',           # "15 Aug"
+        '%d %B',           # "15 August"
+        '%Y-%m-%d',        # "2024-08-15"
+        '%d/%m/%Y',        # "15/08/2024"
+        '%d-%m-%Y'         # "15-08-2024"
+    ]
+    
+    # A recognizable shape gets exactly one strptime attempt; anything else
+    # falls back to trying each format
+    input_format = _date_format_for(date_str)
+    if input_format in ('%d %b', '%d %B'):
+        # Day and month name: no strptime or datetime needed
+        formatted = _format_day_month(date_str)
+        if formatted:
+            return formatted
+        candidates = []
+    else:
+        candidates = [input_format] if input_format else date_formats
+    
+    for input_format in candidates:
+        try:
+            parsed_date = datetime.strptime(date_str, input_format)
+            
+            # Format for output; the year is never written, so a missing one
+            # needs no filling in
+            return parsed_date.strftime('%d %b')
+            
+        except ValueError:
+            continue
+    
+    # If no format matches, return the original string if it looks like a date
+    if _DATE_ANY_RE.search(date_str):
+        return date_str
+    
+    logger.warning(f"Could not parse date: {date_str}")
+    return None
+
 class MessageParser:
     """Parses WhatsApp messages for job application data and commands"""
     
@@ -28,42 +243,18 @@ class MessageParser:
         """Initialize the message parser with regex patterns"""
         
         # Valid job application statuses
-        self.valid_statuses = [
-            'applied', 'not applied', 'not eligible', 'not fixed'
-        ]
+        self.valid_statuses = _VALID_STATUSES
         
-        # Command patterns
-        self.command_patterns = {
-            'show_applied': r'^show\s+applied$',
-            'show_not_applied': r'^show\s+not\s+applied$',
-            'show_not_eligible': r'^show\s+not\s+eligible$',
-            'show_not_fixed': r'^show\s+not\s+fixed$',
-            'latest_status': r'^latest\s+status$',
-            'upcoming': r'^upcoming\s+(applications?)?$',
-            'stats': r'^stats?$',
-            'help': r'^help$',
-            'my_reminders': r'^(my\s+)?reminders?$',
-            'delete': r'^delete\s+(.+)$',
-            'add': r'^add\s+(.+)$'
-        }
+        # Command patterns (compiled once at import)
+        self.command_patterns = _COMMAND_PATTERNS
         
-        # Job update patterns
-        # Pattern: Company Name (optional date) - Status
-        self.job_patterns = [
-            # Company (Date) - Status
-            r'^([^()]+?)\s*\(([^)]+)\)\s*-\s*(.+)$',
-            # Company - Status (no date)
-            r'^([^-]+?)\s*-\s*(.+)$'
-        ]
+        # Job update and date patterns (compiled once at import)
+        self.job_patterns = _JOB_PATTERNS
+        self.date_patterns = _DATE_PATTERNS
         
-        # Date patterns to recognize
-        self.date_patterns = [
-            r'\d{1,2}\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',
-            r'\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)',
-            r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-            r'\d{1,2}/\d{1,2}/\d{4}',  # DD/MM/YYYY
-            r'\d{1,2}-\d{1,2}-\d{4}'   # DD-MM-YYYY
-        ]
+        # Parsed job updates keyed by stripped message; bounded, oldest evicted first
+        self._parse_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._parse_cache_size = 1024
         
         logger.info("Message parser initialized")
     
@@ -81,25 +272,58 @@ class MessageParser:
             return None
         
         message = message.strip()
+        if message in self._parse_cache:
+            cached = self._parse_cache[message]
+            # Hand out a copy so callers can't alter the cached result
+            return dict(cached) if cached else None
+        
+        result = self._parse_job_update_uncached(message)
+        if len(self._parse_cache) >= self._parse_cache_size:
+            self._parse_cache.pop(next(iter(self._parse_cache)), None)
+        self._parse_cache[message] = result
+        return dict(result) if result else None
+    
+    def parse_batch(self, messages: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Parse several job update messages
+        
+        Args:
+            messages: Raw messages from users
+            
+        Returns:
+            Parsed data (or None) for each message, in input order
+        """
+        # Repeated messages in a backlog are parsed once and then served from
+        # the parse cache
+        return [self.parse_job_update(message) for message in messages]
+    
+    def _parse_job_update_uncached(self, message: str) -> Optional[Dict[str, Any]]:
+        """Parse a stripped job update message (see parse_job_update)"""
         logger.info(f"Parsing job update: {message}")
         
-        # Try each job pattern
-        for pattern in self.job_patterns:
-            match = re.match(pattern, message, re.IGNORECASE)
+        # Both job formats need a hyphen separator
+        if '-' not in message:
+            return self._fallback_parsing(message)
+        
+        # Pattern with date: Company (Date) - Status; needs a "("
+        if '(' in message:
+            match = self.job_patterns[0].match(message)
             if match:
-                if len(match.groups()) == 3:
-                    # Pattern with date: Company (Date) - Status
-                    company, date_str, status = match.groups()
-                    return self._process_job_match(company, status, date_str)
-                elif len(match.groups()) == 2:
-                    # Pattern without date: Company - Status
-                    company, status = match.groups()
-                    return self._process_job_match(company, status)
+                company, date_str, status = match.groups()
+                return self._process_job_match(company, status, date_str, raw_message=message)
+        
+        # Pattern without date: Company - Status, i.e. a split on the first
+        # hyphen (same result as the second job pattern, without the regex)
+        company, _, status = message.partition('-')
+        status = status.lstrip()
+        if company and status and '\n' not in status:
+            return self._process_job_match(company, status, raw_message=message)
         
         # If no pattern matches, try to extract basic info
         return self._fallback_parsing(message)
     
-    def _process_job_match(self, company: str, status: str, date_str: str = None) -> Optional[Dict[str, Any]]:
+    def _process_job_match(self, company: str, status: str, date_str: str = None, *,
+                           raw_message: str) -> Optional[Dict[str, Any]]:
         """
         Process matched job components
         
@@ -107,6 +331,7 @@ class MessageParser:
             company: Company name
             status: Job status
             date_str: Optional date string
+            raw_message: The message the components were matched from
             
         Returns:
             Processed job data or None if invalid
@@ -131,14 +356,12 @@ class MessageParser:
         result = {
             'company': company,
             'status': normalized_status,
+            'status_lc': _STATUS_LOWER[normalized_status],
             'original_status': status,
             'date': parsed_date,
-            'raw_message': f"{company} - {status}"
+            'raw_message': raw_message
         }
         
-        if date_str:
-            result['raw_message'] = f"{company} ({date_str}) - {status}"
-        
         logger.info(f"Successfully parsed job update: {result}")
         return result
     
@@ -152,38 +375,8 @@ class MessageParser:
         Returns:
             Normalized status or None if invalid
         """
-        status_lower = status.lower().strip()
-        
-        # Direct matches
-        if status_lower in self.valid_statuses:
-            return status_lower.title()  # Capitalize properly
-        
-        # Status aliases and variations
-        status_aliases = {
-            'applied': ['applied', 'submitted', 'sent', 'done'],
-            'not applied': ['not applied', 'pending', 'todo', 'to do', 'not done', 'not submitted'],
-            'not eligible': ['not eligible', 'ineligible', 'rejected', 'not qualified', 'no match'],
-            'not fixed': ['not fixed', 'uncertain', 'maybe', 'considering', 'thinking', 'undecided']
-        }
-        
-        # Check aliases
-        for normalized, aliases in status_aliases.items():
-            if status_lower in aliases:
-                return normalized.title()
-        
-        # Fuzzy matching for common typos
-        fuzzy_matches = {
-            'applied': ['aplied', 'applyed', 'apllied'],
-            'not applied': ['not aplied', 'not applyed', 'notapplied'],
-            'not eligible': ['not eligable', 'noteligible', 'not elligible'],
-            'not fixed': ['not fixd', 'notfixed', 'not fixxed']
-        }
-        
-        for normalized, fuzzy_list in fuzzy_matches.items():
-            if status_lower in fuzzy_list:
-                return normalized.title()
-        
-        return None
+        # Direct matches, aliases and common typos in one lookup
+        return _STATUS_LOOKUP.get(status.lower().strip())
     
     def _parse_date_string(self, date_str: str) -> Optional[str]:
         """
@@ -198,39 +391,7 @@ class MessageParser:
         if not date_str:
             return None
         
-        date_str = date_str.strip()
-        
-        # Common date formats
-        date_formats = [
-            ('%d %b', '%d %b'),           # "15 Aug" -> "15 Aug"
-            ('%d %B', '%d %b'),           # "15 August" -> "15 Aug"
-            ('%Y-%m-%d', '%d %b'),        # "2024-08-15" -> "15 Aug"
-            ('%d/%m/%Y', '%d %b'),        # "15/08/2024" -> "15 Aug"
-            ('%d-%m-%Y', '%d %b')         # "15-08-2024" -> "15 Aug"
-        ]
-        
-        current_year = datetime.now().year
-        
-        for input_format, output_format in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, input_format)
-                
-                # If no year specified, assume current year
-                if parsed_date.year == 1900:
-                    parsed_date = parsed_date.replace(year=current_year)
-                
-                # Format for output
-                return parsed_date.strftime(output_format)
-                
-            except ValueError:
-                continue
-        
-        # If no format matches, return the original string if it looks like a date
-        if any(re.search(pattern, date_str, re.IGNORECASE) for pattern in self.date_patterns):
-            return date_str
-        
-        logger.warning(f"Could not parse date: {date_str}")
-        return None
+        return _parse_date(date_str.strip())
     
     def _fallback_parsing(self, message: str) -> Optional[Dict[str, Any]]:
         """
@@ -245,40 +406,25 @@ class MessageParser:
         # Look for status keywords in the message
         message_lower = message.lower()
         
-        found_status = None
-        for status in self.valid_statuses:
-            if status in message_lower:
-                found_status = status.title()
-                break
-        
-        if not found_status:
-            # Try aliases
-            for status, aliases in {
-                'Applied': ['applied', 'submitted', 'sent', 'done'],
-                'Not Applied': ['not applied', 'pending', 'todo'],
-                'Not Eligible': ['not eligible', 'rejected', 'ineligible'],
-                'Not Fixed': ['not fixed', 'uncertain', 'maybe']
-            }.items():
-                if any(alias in message_lower for alias in aliases):
-                    found_status = status
-                    break
-        
-        if not found_status:
+        status_match = _FALLBACK_STATUS_RE.match(message_lower)
+        if not status_match:
             return None
+        found_status = _FALLBACK_STATUS_BY_GROUP[status_match.lastgroup]
         
         # Extract company name (everything before the status)
-        status_pos = message_lower.find(found_status.lower())
+        status_pos = message_lower.find(_STATUS_LOWER[found_status])
         if status_pos > 0:
             company_part = message[:status_pos].strip()
             
             # Remove common separators
-            company_part = re.sub(r'\s*[-–—]\s*$', '', company_part)
-            company_part = re.sub(r'\s*[()]\s*$', '', company_part)
+            company_part = _TRAILING_SEPARATOR.sub('', company_part)
+            company_part = _TRAILING_PAREN.sub('', company_part)
             
             if company_part:
                 return {
                     'company': company_part.strip(),
                     'status': found_status,
+                    'status_lc': _STATUS_LOWER[found_status],
                     'original_status': found_status,
                     'date': None,
                     'raw_message': message
@@ -299,14 +445,11 @@ class MessageParser:
         if not message:
             return False
         
-        message_lower = message.lower().strip()
-        
-        # Check against all command patterns
-        for command_type, pattern in self.command_patterns.items():
-            if re.match(pattern, message_lower):
-                return True
-        
-        return False
+        return self._is_command_lower(message.lower().strip())
+    
+    def _is_command_lower(self, message_lower: str) -> bool:
+        """is_command for a message that is already lower-cased and stripped"""
+        return _COMMAND_RE.fullmatch(message_lower) is not None
     
     def parse_command(self, message: str) -> Optional[Dict[str, Any]]:
         """
@@ -321,33 +464,30 @@ class MessageParser:
         if not message:
             return None
         
-        message_lower = message.lower().strip()
+        match = _COMMAND_RE.fullmatch(message.lower().strip())
+        if not match:
+            return None
         
-        # Check each command pattern
-        for command_type, pattern in self.command_patterns.items():
-            match = re.match(pattern, message_lower)
-            if match:
-                result = {
-                    'command': command_type,
-                    'raw_message': message
-                }
-                
-                # Extract parameters for commands that have them
-                if command_type == 'delete' and match.groups():
-                    result['company'] = match.group(1).strip()
-                elif command_type == 'add' and match.groups():
-                    # Parse the add command as a job update
-                    add_content = match.group(1).strip()
-                    job_data = self.parse_job_update(add_content)
-                    if job_data:
-                        result['job_data'] = job_data
-                    else:
-                        return None  # Invalid add command
-                
-                logger.info(f"Parsed command: {result}")
-                return result
+        command_type = match.lastgroup
+        result = {
+            'command': command_type,
+            'raw_message': message
+        }
         
-        return None
+        # Extract parameters for commands that have them
+        if command_type == 'delete':
+            result['company'] = match.group('delete_arg').strip()
+        elif command_type == 'add':
+            # Parse the add command as a job update
+            add_content = match.group('add_arg').strip()
+            job_data = self.parse_job_update(add_content)
+            if job_data:
+                result['job_data'] = job_data
+            else:
+                return None  # Invalid add command
+        
+        logger.info(f"Parsed command: {result}")
+        return result
     
     def extract_company_names(self, text: str) -> List[str]:
         """
@@ -362,23 +502,8 @@ class MessageParser:
         if not text:
             return []
         
-        # Common company suffixes and prefixes to help identify companies
-        company_indicators = [
-            r'\b\w+\s+(inc|corp|ltd|llc|company|technologies|tech|systems|solutions|group|enterprises)\b',
-            r'\b(google|amazon|microsoft|apple|facebook|meta|netflix|uber|airbnb|tesla|spacex)\b',
-            r'\b\w+\s+(labs|studios|ventures|capital|partners|consulting|services)\b'
-        ]
-        
-        potential_companies = []
-        
-        for pattern in company_indicators:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            potential_companies.extend(matches)
-        
-        # Remove duplicates and clean up
-        unique_companies = list(set([company.strip() for company in potential_companies if company.strip()]))
-        
-        return unique_companies
+        # One scan over the text; dict keeps the first-seen order while deduplicating
+        return list(dict.fromkeys(match.group(1) for match in _COMPANY_INDICATORS.finditer(text)))
     
     def validate_message_format(self, message: str) -> Dict[str, Any]:
         """
@@ -398,9 +523,10 @@ class MessageParser:
             }
         
         message = message.strip()
+        message_lower = message.lower()
         
         # Check if it's a command
-        if self.is_command(message):
+        if self._is_command_lower(message_lower):
             return {'valid': True, 'type': 'command'}
         
         # Check if it can be parsed as job update
@@ -415,14 +541,7 @@ class MessageParser:
             suggestions.append('Example: Google - Applied')
         
         # Check for valid status
-        has_valid_status = False
-        message_lower = message.lower()
-        for status in self.valid_statuses:
-            if status in message_lower:
-                has_valid_status = True
-                break
-        
-        if not has_valid_status:
+        if not _VALID_STATUS_RE.search(message_lower):
             suggestions.append('Use valid status: Applied, Not Applied, Not Eligible, Not Fixed')
         
         if '(' in message and ')' not in message:
@@ -470,12 +589,10 @@ class MessageParser:
         if not text:
             return None
         
-        # Look for date patterns in the text
-        for pattern in self.date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                # Return the first match and try to parse it
-                return self._parse_date_string(matches[0])
+        # Look for the first date in the text
+        match = _DATE_ANY_RE.search(text)
+        if match:
+            return self._parse_date_string(match.group(0))
         
         return None
     
@@ -493,7 +610,7 @@ class MessageParser:
             return ""
         
         # Remove extra whitespace
-        company = re.sub(r'\s+', ' ', company.strip())
+        company = ' '.join(company.split())
         
         # Remove common suffixes for consistency (optional)
         # company = re.sub(r'\s+(inc|corp|ltd|llc)\.?, '', company, flags=re.IGNORECASE)
@@ -510,9 +627,4 @@ class MessageParser:
         Returns:
             Dictionary mapping normalized status to variations
         """
-        return {
-            'Applied': ['applied', 'submitted', 'sent', 'done', 'complete'],
-            'Not Applied': ['not applied', 'pending', 'todo', 'to do', 'not done', 'not submitted'],
-            'Not Eligible': ['not eligible', 'ineligible', 'rejected', 'not qualified', 'no match'],
-            'Not Fixed': ['not fixed', 'uncertain', 'maybe', 'considering', 'thinking', 'undecided']
-        }
\ No newline at end of file
+        return {status: list(aliases) for status, aliases in _STATUS_VARIATIONS.items()}
\ No newline at end of file
@@ -8,42 +8,149 @@ Author: Senior Python Developer
 Version: 1.1 (Fixed)
 """
 
+import calendar
 import logging
-import json
+import re
+import threading
+import orjson
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, every process checks reminders
+    fcntl = None
 from datetime import datetime, timedelta, time
+from time import monotonic
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import pytz
 
 logger = logging.getLogger(__name__)
 
+# Reminders are scheduled and checked in Indian Standard Time
+_IST = pytz.timezone('Asia/Kolkata')
+
+# Month names and abbreviations ("aug", "august") -> month number
+_MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
+_MONTHS.update({name.lower(): i for i, name in enumerate(calendar.month_name) if name})
+
+# Reminder date formats: "15 Aug" / "15 August", "2024-08-15", "15/08/2024", "15-08-2024"
+_DATE_RE = re.compile(
+    r'^(?:(\d{1,2})\s+([A-Za-z]+)'
+    r'|(\d{4})-(\d{1,2})-(\d{1,2})'
+    r'|(\d{1,2})([/-])(\d{1,2})\7(\d{4}))$'
+)
+
+# Reminder message copy by Reminder Type. Messages are rendered from these when
+# sent, so wording changes also apply to reminders already in the sheet; the
+# stored Message column is a readable copy and the fallback for unknown types.
+_REMINDER_TEMPLATES = {
+    'applied': "🚨 Reminder: Apply to {company} today! Don't forget to submit your application.",
+    'daily': "📝 Daily Reminder: You haven't applied to {company} yet. Consider applying today!"
+}
+
+# Request headers for orjson-encoded bodies posted to the reminder endpoints
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Read timeout for one batch POST. The app paces Twilio sends, so each batch
+# is sized to finish in about half of this at the paced rate, leaving the
+# rest for 429/503 backoff.
+_BATCH_READ_TIMEOUT = 30
+
+# Backoff before resending an applied reminder whose send failed; it doubles
+# with each consecutive failure up to the cap
+_RETRY_BACKOFF = timedelta(minutes=5)
+_RETRY_BACKOFF_MAX = timedelta(hours=1)
+
+@lru_cache(maxsize=4096)
+def _parse_trigger_time(trigger_time: str) -> datetime:
+    """
+    Parse an applied reminder's ISO trigger time
+    
+    Pending triggers are re-checked every minute with the same strings, so
+    parses are memoized (datetimes are immutable and safe to share).
+    
+    Args:
+        trigger_time: ISO timestamp stored in the Trigger Time column
+        
+    Returns:
+        Timezone-aware datetime
+    """
+    return datetime.fromisoformat(trigger_time)
+
+@lru_cache(maxsize=1024)
+def _parse_daily_trigger(trigger_info: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a daily reminder's "daily_HH:MM" trigger, memoized like ISO triggers
+    
+    Args:
+        trigger_info: Value stored in the Trigger Time column
+        
+    Returns:
+        (hour, minute), or None if the trigger is not a daily time pattern
+    """
+    if not trigger_info.startswith('daily_'):
+        return None
+    
+    hour, minute = map(int, trigger_info.removeprefix('daily_').split(':'))
+    return hour, minute
+
+def _normalize_user_id(user_id) -> str:
+    """Normalize a user ID for comparison (no whitespace or leading +)"""
+    return str(user_id).strip().lstrip('+')
+
+@lru_cache(maxsize=1)
+def _load_config() -> Dict[str, Any]:
+    """
+    Read config.json once per process, for managers created without a config
+    
+    Returns:
+        Parsed configuration; shared between instances, do not modify
+    """
+    with open('config.json', 'rb') as f:
+        return orjson.loads(f.read())
+
 class SchedulerManager:
     """Manages scheduled reminders for job applications using Google Sheets storage"""
     
-    def __init__(self):
-        """Initialize the scheduler with Google Sheets storage"""
+    def __init__(self, config: Dict[str, Any] = None, sheets_manager=None):
+        """
+        Initialize the scheduler with Google Sheets storage
+        
+        Args:
+            config: Full application configuration; read from config.json when omitted
+            sheets_manager: The app's GoogleSheetsManager, shared so the process
+                keeps one authorized client; created on first use when omitted
+        """
         
-        # Load configuration
-        with open('config.json', 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # Load configuration (the app passes the copy it already parsed)
+        self.config = config if config is not None else _load_config()
         
         # Configure APScheduler (only for the checker job)
         jobstores = {
             'default': MemoryJobStore()
         }
         
+        # Only the reminder checker runs here, one instance at a time; pool
+        # threads are started on demand
         executors = {
-            'default': ThreadPoolExecutor(max_workers=20)
+            'default': ThreadPoolExecutor(
+                max_workers=self.config.get('scheduler', {}).get('executor_workers', 4)
+            )
         }
         
+        # Runs missed while the process was stalled collapse into one late run
+        # (up to an hour late) instead of a burst of back-to-back checks
         job_defaults = {
-            'coalesce': False,
-            'max_instances': 3,
-            'misfire_grace_time': 30
+            'coalesce': True,
+            'max_instances': 1,  # an overlapping checker run could send reminders twice
+            'misfire_grace_time': 3600
         }
         
         # Initialize scheduler
@@ -51,7 +158,72 @@ class SchedulerManager:
             jobstores=jobstores,
             executors=executors,
             job_defaults=job_defaults,
-            timezone='Asia/Kolkata'
+            timezone=_IST
+        )
+        
+        # Held for the life of the process by whichever worker owns the checker
+        self._lock_file = None
+        
+        # Sheets manager for the Reminders worksheet; it keeps the authorized
+        # client and worksheet handle for later calls
+        self._sheets_manager = sheets_manager
+        self._sheets_manager_lock = threading.Lock()
+        
+        # Reminder records as last read from the sheet: (fetched_at, records,
+        # record indices by normalized user ID). Every write through this
+        # manager drops the cache; the TTL bounds how long edits made elsewhere
+        # go unseen. The cache only serves reads: rows can shift under it
+        # (hand edits, another worker), so anything that writes by row number
+        # reads fresh first. The generation counter stops a read that raced a
+        # write from caching pre-write records.
+        self._records_cache = None
+        self._records_cache_ttl = self.config.get('reminders', {}).get('cache_ttl_seconds', 60)
+        self._records_generation = 0
+        self._records_lock = threading.Lock()
+        
+        # When the reminder checker last completed a sweep (IST)
+        self._last_check = None
+        
+        # (records generation, time) before which the last sweep found nothing
+        # that could come due; ticks until then skip the sheet entirely. The
+        # idle limit bounds how long edits made elsewhere wait to be seen.
+        self._idle_until = None
+        self._idle_recheck = timedelta(
+            minutes=self.config.get('reminders', {}).get('idle_recheck_minutes', 15)
+        )
+        
+        # Applied reminders whose last send failed: Reminder ID ->
+        # (consecutive failures, earliest retry time)
+        self._send_retries: Dict[str, Tuple[int, datetime]] = {}
+        
+        # Every daily reminder shares the configured time, stored as "daily_HH:MM"
+        reminder_config = self.config.get('reminders', {})
+        self._daily_trigger_time = (
+            f"daily_{reminder_config.get('daily_reminder_hour', 9):02d}:"
+            f"{reminder_config.get('daily_reminder_minute', 0):02d}"
+        )
+        
+        # Flask app URL for reminder delivery
+        self._base_url = self.config.get('flask', {}).get('base_url', 'https://job-tracker-1-9su6.onrender.com')
+        
+        # One pooled session keeps connections to the app alive between
+        # reminders. Only connection failures are retried: a request that
+        # reached the app may already have sent WhatsApp messages.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Largest batch the app can send within half the read timeout: one
+        # burst, then the sustained rate
+        twilio_config = self.config.get('twilio', {})
+        self._batch_size = int(
+            twilio_config.get('rate_limit_burst', 20)
+            + twilio_config.get('rate_limit_per_second', 10) * _BATCH_READ_TIMEOUT / 2
         )
         
         logger.info("Scheduler manager initialized with Google Sheets storage")
@@ -59,29 +231,120 @@ class SchedulerManager:
     def _get_reminders_worksheet(self):
         """Get or create the reminders worksheet"""
         try:
-            from google_sheets import GoogleSheetsManager
-            sheets_manager = GoogleSheetsManager(self.config['google_sheets'])
+            if self._sheets_manager is None:
+                with self._sheets_manager_lock:
+                    if self._sheets_manager is None:
+                        from google_sheets import GoogleSheetsManager
+                        self._sheets_manager = GoogleSheetsManager(self.config['google_sheets'])
             
-            try:
-                worksheet = sheets_manager.spreadsheet.worksheet("Reminders")
-            except:
-                worksheet = sheets_manager.spreadsheet.add_worksheet(
-                    title="Reminders", rows=1000, cols=8
-                )
-                worksheet.append_row([
-                    'Reminder ID', 'User ID', 'Company', 'Reminder Type', 
-                    'Trigger Time', 'Message', 'Status', 'Created Date'
-                ])
-            
-            return worksheet
+            return self._sheets_manager.get_reminders_worksheet()
         except Exception as e:
             logger.error(f"Error getting reminders worksheet: {e}")
             return None
     
+    def _get_reminder_records(self, worksheet, fresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get all reminder records, served from memory while the cache is fresh
+        
+        Args:
+            worksheet: Reminders worksheet
+            fresh: Read the sheet even if the cache is fresh; required when the
+                row numbers will be used to write
+            
+        Returns:
+            List of reminder records in sheet order (row = index + 2); shared, do not modify
+        """
+        return self._get_cached_records(worksheet, fresh)[1]
+    
+    def _get_user_reminder_records(self, worksheet, user_id: str,
+                                   fresh: bool = False) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Get one user's reminder records through the cached user index
+        
+        Args:
+            worksheet: Reminders worksheet
+            user_id: User's identifier, with or without a leading +
+            fresh: Read the sheet even if the cache is fresh; required when the
+                row numbers will be used to write
+            
+        Returns:
+            (row number, record) pairs in sheet order; records are shared, do not modify
+        """
+        _, records, by_user = self._get_cached_records(worksheet, fresh)
+        return [(i + 2, records[i]) for i in by_user.get(_normalize_user_id(user_id), ())]
+    
+    def _get_cached_records(self, worksheet,
+                            fresh: bool = False) -> Tuple[float, List[Dict[str, Any]], Dict[str, List[int]]]:
+        """
+        Get the records cache entry, reading the sheet when it is stale
+        
+        Args:
+            worksheet: Reminders worksheet
+            fresh: Skip the cache and read the sheet (the result is still cached)
+            
+        Returns:
+            (fetched_at, records, record indices by normalized user ID)
+        """
+        with self._records_lock:
+            cached = self._records_cache
+            if not fresh and cached and monotonic() - cached[0] < self._records_cache_ttl:
+                return cached
+            generation = self._records_generation
+        
+        # One ranged read of columns A:G (Created Date is never needed), keyed by
+        # the header row; values stay as the sheet's strings
+        rows = worksheet.get_values('A1:G')
+        header = rows[0] if rows else []
+        records = [dict(zip(header, row)) for row in rows[1:]]
+        
+        # Per-user lookups (cancel, summary, reschedule) skip everyone else's rows
+        by_user = {}
+        for i, record in enumerate(records):
+            by_user.setdefault(_normalize_user_id(record.get('User ID', '')), []).append(i)
+        
+        entry = (monotonic(), records, by_user)
+        with self._records_lock:
+            if generation == self._records_generation:
+                self._records_cache = entry
+        return entry
+    
+    def _invalidate_records_cache(self):
+        """Drop cached reminder records after a write to the sheet"""
+        with self._records_lock:
+            self._records_generation += 1
+            self._records_cache = None
+    
+    def _acquire_checker_lock(self) -> bool:
+        """
+        Take the process-wide reminder checker lock without blocking
+        
+        Returns:
+            True if this process should run the reminder checker
+        """
+        if fcntl is None:
+            return True
+        
+        lock_path = self.config.get('reminders', {}).get('lock_file', 'scheduler.lock')
+        lock_file = open(lock_path, 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        
+        self._lock_file = lock_file
+        return True
+    
     def start(self):
         """Start the scheduler with periodic reminder checker"""
         try:
             self.scheduler.start()
+            
+            # Reminders live in Google Sheets, so only one worker may poll them
+            if not self._acquire_checker_lock():
+                logger.info("Scheduler started; reminder checker owned by another worker")
+                return
+            
             # Check for due reminders every minute
             self.scheduler.add_job(
                 func=self._check_and_send_reminders,
@@ -97,6 +360,7 @@ class SchedulerManager:
         """Shutdown the scheduler"""
         try:
             self.scheduler.shutdown(wait=False)
+            self._session.close()
             logger.info("Scheduler shutdown successfully")
         except Exception as e:
             logger.error(f"Error shutting down scheduler: {e}")
@@ -121,9 +385,8 @@ class SchedulerManager:
             
             # Set reminder time to 1:00 AM on the application date
             naive_reminder_time = datetime.combine(parsed_date.date(), time(1, 0))
-            IST = pytz.timezone('Asia/Kolkata')
-            reminder_time = IST.localize(naive_reminder_time)
-            now = datetime.now(IST)
+            reminder_time = _IST.localize(naive_reminder_time)
+            now = datetime.now(_IST)
             
             # Only schedule if the date is in the future
             if reminder_time <= now:
@@ -134,13 +397,10 @@ class SchedulerManager:
             worksheet = self._get_reminders_worksheet()
             if worksheet:
                 reminder_id = f"applied_reminder_{user_id}_{company}_{parsed_date.strftime('%Y%m%d')}"
-                message = f"🚨 Reminder: Apply to {company} today! Don't forget to submit your application."
-                
-                # Remove existing reminder if any
-                self._remove_reminder_from_sheet(reminder_id)
+                message = _REMINDER_TEMPLATES['applied'].format(company=company)
                 
-                # Add new reminder
-                worksheet.append_row([
+                # Add new reminder (replacing any existing one)
+                self._upsert_reminder(worksheet, [
                     reminder_id,
                     user_id,
                     company,
@@ -167,30 +427,20 @@ class SchedulerManager:
         try:
             logger.info(f"Scheduling daily reminder for user {user_id}, company {company}")
             
-            # Get reminder time from config
-            reminder_config = self.config.get('reminders', {})
-            reminder_hour = reminder_config.get('daily_reminder_hour', 9)
-            reminder_minute = reminder_config.get('daily_reminder_minute', 0)
-            
             # Store in Google Sheets
             worksheet = self._get_reminders_worksheet()
             if worksheet:
                 reminder_id = f"daily_reminder_{user_id}_{company}"
-                message = f"📝 Daily Reminder: You haven't applied to {company} yet. Consider applying today!"
-                
-                # Remove existing reminder if any
-                self._remove_reminder_from_sheet(reminder_id)
-                
-                # For daily reminders, we store the time pattern instead of specific datetime
-                trigger_time = f"daily_{reminder_hour:02d}:{reminder_minute:02d}"
+                message = _REMINDER_TEMPLATES['daily'].format(company=company)
                 
-                # Add new reminder
-                worksheet.append_row([
+                # Add new reminder (replacing any existing one); daily reminders
+                # store the time pattern instead of a specific datetime
+                self._upsert_reminder(worksheet, [
                     reminder_id,
                     user_id,
                     company,
                     'daily',
-                    trigger_time,
+                    self._daily_trigger_time,
                     message,
                     'pending',
                     datetime.now().isoformat()
@@ -214,129 +464,186 @@ class SchedulerManager:
             if not worksheet:
                 return
             
-            # Get all reminders
-            records = worksheet.get_all_records()
-            rows_to_delete = []
+            # Company names compare case-insensitively
+            lookup_company = str(company).strip().lower()
             
-            # Find rows to delete (collect row numbers first)
-            for i, record in enumerate(records):
-                # Normalize user IDs for comparison
-                sheet_user_id = str(record.get('User ID', '')).strip().lstrip('+')
-                lookup_user_id = str(user_id).strip().lstrip('+')
-                
-                # Normalize company names for case-insensitive comparison
-                sheet_company = str(record.get('Company', '')).strip().lower()
-                lookup_company = str(company).strip().lower()
-                
-                if (sheet_user_id == lookup_user_id and 
-                    sheet_company == lookup_company and 
-                    record.get('Status') == 'pending'):
-                    rows_to_delete.append(i + 2)  # +2 because sheets are 1-indexed and we have headers
+            # Find this user's rows to delete (collect row numbers first), from
+            # a fresh read so the row numbers match the sheet
+            rows_to_delete = [
+                row_num for row_num, record in self._get_user_reminder_records(worksheet, user_id, fresh=True)
+                if (record.get('Status') == 'pending' and
+                    str(record.get('Company', '')).strip().lower() == lookup_company)
+            ]
             
-            # Delete rows in reverse order to avoid index shifting issues
-            removed_count = 0
-            for row_num in reversed(rows_to_delete):
-                try:
-                    worksheet.delete_rows(row_num)
-                    removed_count += 1
-                    logger.info(f"Deleted reminder row {row_num}")
-                except Exception as e:
-                    logger.error(f"Error deleting row {row_num}: {e}")
+            if not rows_to_delete:
+                logger.info(f"Cancelled 0 reminders for {company}")
+                return
             
-            logger.info(f"Cancelled {removed_count} reminders for {company}")
+            # Delete all rows in one atomic batchUpdate; requests apply in
+            # order, so bottom-up avoids index shifting issues
+            worksheet.spreadsheet.batch_update({'requests': [
+                {'deleteDimension': {'range': {
+                    'sheetId': worksheet.id,
+                    'dimension': 'ROWS',
+                    'startIndex': row_num - 1,
+                    'endIndex': row_num
+                }}}
+                for row_num in reversed(rows_to_delete)
+            ]})
+            self._invalidate_records_cache()
+            
+            logger.info(f"Cancelled {len(rows_to_delete)} reminders for {company}")
             
         except Exception as e:
             logger.error(f"Error cancelling reminders: {e}")
     
-    def _remove_reminder_from_sheet(self, reminder_id: str):
-        """Remove a specific reminder from the sheet"""
+    def _upsert_reminder(self, worksheet, row: List[Any]):
+        """
+        Write a reminder row, overwriting the existing row with the same Reminder ID
+        
+        Args:
+            worksheet: Reminders worksheet
+            row: Reminder row values, starting with the Reminder ID
+        """
+        # Only the ID column is needed to find an existing reminder
+        reminder_ids = worksheet.col_values(1)
         try:
-            worksheet = self._get_reminders_worksheet()
-            if not worksheet:
-                return
-            
-            records = worksheet.get_all_records()
-            row_to_delete = None
-            
-            # Find the row to delete
-            for i, record in enumerate(records):
-                if record.get('Reminder ID') == reminder_id:
-                    row_to_delete = i + 2  # +2 for 1-indexing and headers
-                    break
-            
-            # Delete the row if found
-            if row_to_delete:
-                try:
-                    worksheet.delete_rows(row_to_delete)
-                    logger.info(f"Removed reminder {reminder_id} from row {row_to_delete}")
-                except Exception as e:
-                    logger.error(f"Error deleting reminder row {row_to_delete}: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error removing reminder from sheet: {e}")
+            row_num = reminder_ids.index(row[0], 1) + 1  # skip the header; 1-indexed
+        except ValueError:
+            row_num = None
+        
+        try:
+            if row_num is None:
+                worksheet.append_row(row)
+            else:
+                worksheet.update(f'A{row_num}:H{row_num}', [row])
+                logger.info(f"Replaced reminder {row[0]} in row {row_num}")
+        finally:
+            self._invalidate_records_cache()
     
     def _check_and_send_reminders(self):
         """Check Google Sheets for due reminders and send them"""
         try:
+            now = datetime.now(_IST)
+            
+            # Nothing can be due before the earliest trigger seen last sweep,
+            # unless a reminder was written through this manager since
+            idle_until = self._idle_until
+            if idle_until and idle_until[0] == self._records_generation and now < idle_until[1]:
+                return
+            
             worksheet = self._get_reminders_worksheet()
             if not worksheet:
                 return
             
-            records = worksheet.get_all_records()
-            now = datetime.now(pytz.timezone('Asia/Kolkata'))
+            # Read fresh: this sweep decides what to send and marks rows sent
+            generation = self._records_generation
+            records = self._get_reminder_records(worksheet, fresh=True)
             sent_count = 0
             rows_to_update = []
+            due = []
+            
+            # Daily reminders fire when their latest occurrence falls after the
+            # previous sweep, so a late or skipped tick still sends them once
+            last_check = self._last_check or now - timedelta(minutes=1)
+            next_due = now + self._idle_recheck
             
-            for i, record in enumerate(records):
+            # Rebuilt each sweep, so reminders sent or deleted elsewhere drop out
+            send_retries = {}
+            
+            for record in records:
                 if record.get('Status') != 'pending':
                     continue
                 
                 should_send = False
-                row_num = i + 2  # +2 for 1-indexing and headers
                 
                 if record.get('Reminder Type') == 'applied':
                     # Check if it's time for applied reminder
                     try:
-                        trigger_time = datetime.fromisoformat(record['Trigger Time'])
-                        if now >= trigger_time:
+                        trigger_time = _parse_trigger_time(record['Trigger Time'])
+                        retry = self._send_retries.get(record.get('Reminder ID'))
+                        if retry and now < retry[1]:
+                            # Failed recently; wait out its backoff
+                            send_retries[record.get('Reminder ID')] = retry
+                            next_due = min(next_due, retry[1])
+                        elif now >= trigger_time:
                             should_send = True
+                        else:
+                            next_due = min(next_due, trigger_time)
                     except Exception as e:
                         logger.error(f"Error parsing applied reminder time: {e}")
                         continue
                         
                 elif record.get('Reminder Type') == 'daily':
                     # Check if it's time for daily reminder
-                    trigger_info = record.get('Trigger Time', '')
-                    if trigger_info.startswith('daily_'):
-                        try:
-                            time_part = trigger_info.replace('daily_', '')
-                            hour, minute = map(int, time_part.split(':'))
+                    try:
+                        daily_time = _parse_daily_trigger(record.get('Trigger Time', ''))
+                        if daily_time:
+                            hour, minute = daily_time
                             
-                            # Check if current time matches the daily reminder time
-                            if now.hour == hour and now.minute == minute:
+                            # Most recent occurrence of the daily time, up to now
+                            occurrence = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                            if occurrence > now:
+                                occurrence -= timedelta(days=1)
+                            if occurrence > last_check:
                                 should_send = True
-                        except Exception as e:
-                            logger.error(f"Error parsing daily reminder time: {e}")
-                            continue
+                            next_due = min(next_due, occurrence + timedelta(days=1))
+                    except Exception as e:
+                        logger.error(f"Error parsing daily reminder time: {e}")
+                        continue
                 
                 if should_send:
-                    # Send the reminder
-                    result = self._send_reminder(record.get('User ID'), record.get('Message'))
+                    due.append(record)
+            
+            # Send everything that is due this minute in as few requests as fit
+            # the read timeout
+            results = self._send_reminders_batch([
+                (record.get('User ID'), self._reminder_message(record)) for record in due
+            ])
+            
+            for record, result in zip(due, results):
+                if result is not False:
+                    # None means the batch was dispatched but its outcome never
+                    # came back; treat it as sent rather than risk a duplicate
                     if result:
                         sent_count += 1
-                        
-                        # For applied reminders, mark as sent (one-time)
-                        if record.get('Reminder Type') == 'applied':
-                            rows_to_update.append((row_num, 'sent'))
-                        # For daily reminders, keep as pending for next day
-                        # (they will be checked again tomorrow)
-            
-            # Update status for sent reminders
-            for row_num, status in rows_to_update:
+                    
+                    # For applied reminders, mark as sent (one-time)
+                    if record.get('Reminder Type') == 'applied':
+                        rows_to_update.append((record.get('Reminder ID'), 'sent'))
+                    # For daily reminders, keep as pending for next day
+                    # (they will be checked again tomorrow)
+                elif record.get('Reminder Type') == 'applied':
+                    # Still pending; retry only this reminder, after a backoff
+                    failures = self._send_retries.get(record.get('Reminder ID'), (0, now))[0] + 1
+                    retry_at = now + min(_RETRY_BACKOFF * 2 ** (failures - 1), _RETRY_BACKOFF_MAX)
+                    send_retries[record.get('Reminder ID')] = (failures, retry_at)
+                    next_due = min(next_due, retry_at)
+            
+            # Update status for sent reminders in one values.batchUpdate. Rows
+            # may have moved while the batch was sending, so each reminder's
+            # current row is looked up by its ID; ones since deleted are skipped.
+            if rows_to_update:
                 try:
-                    worksheet.update(f'G{row_num}', status)  # Status column
+                    reminder_ids = worksheet.col_values(1)
+                    row_by_id = {}
+                    for i, reminder_id in enumerate(reminder_ids[1:], start=2):
+                        row_by_id.setdefault(reminder_id, i)
+                    
+                    updates = [
+                        {'range': f'G{row_by_id[reminder_id]}', 'values': [[status]]}  # Status column
+                        for reminder_id, status in rows_to_update
+                        if reminder_id in row_by_id
+                    ]
+                    if updates:
+                        worksheet.batch_update(updates)
                 except Exception as e:
-                    logger.error(f"Error updating reminder status for row {row_num}: {e}")
+                    logger.error(f"Error updating status for {len(rows_to_update)} reminders: {e}")
+                self._invalidate_records_cache()
+            
+            self._last_check = now
+            self._send_retries = send_retries
+            self._idle_until = (generation, next_due)
             
             if sent_count > 0:
                 logger.info(f"Sent {sent_count} reminders")
@@ -344,6 +651,21 @@ class SchedulerManager:
         except Exception as e:
             logger.error(f"Error checking and sending reminders: {e}")
     
+    def _reminder_message(self, record: Dict[str, Any]) -> str:
+        """
+        Render the message for a reminder record from the current templates
+        
+        Args:
+            record: Reminders sheet record
+            
+        Returns:
+            Message text
+        """
+        template = _REMINDER_TEMPLATES.get(record.get('Reminder Type'))
+        if not template:
+            return record.get('Message')
+        return template.format(company=record.get('Company', ''))
+    
     def _send_reminder(self, user_id: str, message: str) -> bool:
         """
         Send a reminder message via the Flask app's reminder endpoint
@@ -356,18 +678,15 @@ class SchedulerManager:
             True if sent successfully
         """
         try:
-            # Get the Flask app URL from config
-            app_config = self.config.get('flask', {})
-            base_url = app_config.get('base_url', 'https://job-tracker-1-9su6.onrender.com')
-            
             # Send POST request to the reminder endpoint
-            response = requests.post(
-                f"{base_url}/send_reminder",
-                json={
+            response = self._session.post(
+                f"{self._base_url}/send_reminder",
+                data=orjson.dumps({
                     'user_id': user_id,
                     'message': message
-                },
-                timeout=10
+                }),
+                headers=_JSON_HEADERS,
+                timeout=(3, 10)
             )
             
             if response.ok:
@@ -381,6 +700,78 @@ class SchedulerManager:
             logger.error(f"Error sending reminder: {e}")
             return False
     
+    def _send_reminders_batch(self, reminders: List[Tuple[str, str]]) -> List[Optional[bool]]:
+        """
+        Send several reminders via the Flask app's batch reminder endpoint
+        
+        Args:
+            reminders: List of (user_id, message) tuples
+            
+        Returns:
+            One entry per reminder, in order: True if sent, False if not, and
+            None if its batch was dispatched but the response timed out
+        """
+        results: List[Optional[bool]] = []
+        for start in range(0, len(reminders), self._batch_size):
+            chunk = reminders[start:start + self._batch_size]
+            try:
+                chunk_results = self._post_reminder_batch(chunk)
+            except requests.exceptions.ReadTimeout:
+                # The app may still be sending this batch, so its outcome is
+                # unknown; later batches wait for the next tick
+                logger.error(f"Reminder batch of {len(chunk)} timed out; not resending it")
+                results.extend([None] * len(chunk))
+                break
+            results.extend(chunk_results)
+        
+        results.extend([False] * (len(reminders) - len(results)))
+        return results
+    
+    def _post_reminder_batch(self, reminders: List[Tuple[str, str]]) -> List[bool]:
+        """
+        POST one batch to the app's batch reminder endpoint
+        
+        Args:
+            reminders: List of (user_id, message) tuples
+            
+        Returns:
+            List of booleans, True where the reminder was sent successfully
+            
+        Raises:
+            requests.exceptions.ReadTimeout: The batch was sent but no response arrived
+        """
+        try:
+            response = self._session.post(
+                f"{self._base_url}/send_reminders_batch",
+                data=orjson.dumps({
+                    'messages': [
+                        {'user_id': user_id, 'message': message}
+                        for user_id, message in reminders
+                    ]
+                }),
+                headers=_JSON_HEADERS,
+                timeout=(3, _BATCH_READ_TIMEOUT)
+            )
+            
+            if not response.ok:
+                logger.error(f"Failed to send reminder batch: {response.status_code} - {response.text}")
+                return [False] * len(reminders)
+            
+            # Results come back one per reminder, in order; any missing ones
+            # count as failed without affecting the rest
+            results = response.json().get('results', [])
+            if len(results) != len(reminders):
+                logger.error(f"Reminder batch returned {len(results)} results for {len(reminders)} reminders")
+            
+            sent = [bool(result.get('success')) for result in results[:len(reminders)]]
+            return sent + [False] * (len(reminders) - len(sent))
+            
+        except requests.exceptions.ReadTimeout:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending reminder batch: {e}")
+            return [False] * len(reminders)
+    
     def _parse_date(self, date_str: str) -> datetime:
         """
         Parse various date formats
@@ -394,33 +785,50 @@ class SchedulerManager:
         if not date_str:
             return None
         
-        # Common date formats to try
-        formats = [
-            '%d %b',      # "15 Aug"
-            '%d %B',      # "15 August"  
-            '%Y-%m-%d',   # "2024-08-15"
-            '%d/%m/%Y',   # "15/08/2024"
-            '%d-%m-%Y',   # "15-08-2024"
-        ]
-        
-        current_year = datetime.now().year
-        
-        for date_format in formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), date_format)
-                
-                # If no year specified, assume current year
-                if parsed_date.year == 1900:
-                    parsed_date = parsed_date.replace(year=current_year)
-                
-                return parsed_date
-                
-            except ValueError:
-                continue
+        # One regex match picks the format; no strptime attempts
+        match = _DATE_RE.match(date_str.strip())
+        if match:
+            day_mon, mon_name, iso_y, iso_m, iso_d, dmy_d, _, dmy_m, dmy_y = match.groups()
+            if day_mon:
+                # No year specified: assume current year
+                year, month, day = datetime.now().year, _MONTHS.get(mon_name.lower()), int(day_mon)
+            elif iso_y:
+                year, month, day = int(iso_y), int(iso_m), int(iso_d)
+            else:
+                year, month, day = int(dmy_y), int(dmy_m), int(dmy_d)
+            
+            if month:
+                try:
+                    return datetime(year, month, day)
+                except ValueError:
+                    pass
         
         logger.warning(f"Could not parse date: {date_str}")
         return None
     
+    def _next_daily_run(self, trigger_info: str, now: datetime) -> Optional[datetime]:
+        """
+        Calculate the next occurrence of a daily reminder
+        
+        Args:
+            trigger_info: Stored trigger time, e.g. "daily_09:00"
+            now: Current time in IST
+            
+        Returns:
+            Next run time, or None if the trigger is not a daily time pattern
+        """
+        daily_time = _parse_daily_trigger(trigger_info)
+        if not daily_time:
+            return None
+        
+        hour, minute = daily_time
+        next_run_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        
+        # If today's time has passed, schedule for tomorrow
+        if next_run_time <= now:
+            next_run_time += timedelta(days=1)
+        return next_run_time
+    
     def get_scheduled_jobs(self, user_id: str = None) -> list:
         """
         Get list of scheduled reminders from Google Sheets
@@ -436,45 +844,28 @@ class SchedulerManager:
             if not worksheet:
                 return []
             
-            records = worksheet.get_all_records()
+            # Filter by user if specified
+            if user_id:
+                records = [record for _, record in self._get_user_reminder_records(worksheet, user_id)]
+            else:
+                records = self._get_reminder_records(worksheet)
             reminders = []
+            now = datetime.now(_IST)
             
             for record in records:
                 # Skip non-pending reminders
                 if record.get('Status') != 'pending':
                     continue
-                    
-                # Filter by user if specified
-                if user_id:
-                    # Normalize user IDs for comparison
-                    sheet_user_id = str(record.get('User ID', '')).strip().lstrip('+')
-                    lookup_user_id = str(user_id).strip().lstrip('+')
-                    
-                    if sheet_user_id != lookup_user_id:
-                        continue
                 
                 # Calculate next run time
                 next_run = None
                 if record.get('Reminder Type') == 'applied':
-                    try:
-                        next_run = record.get('Trigger Time')
-                    except:
-                        pass
+                    next_run = record.get('Trigger Time')
                 elif record.get('Reminder Type') == 'daily':
                     # For daily reminders, calculate next occurrence
                     try:
-                        trigger_info = record.get('Trigger Time', '')
-                        if trigger_info.startswith('daily_'):
-                            time_part = trigger_info.replace('daily_', '')
-                            hour, minute = map(int, time_part.split(':'))
-                            
-                            now = datetime.now(pytz.timezone('Asia/Kolkata'))
-                            next_run_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                            
-                            # If today's time has passed, schedule for tomorrow
-                            if next_run_time <= now:
-                                next_run_time += timedelta(days=1)
-                                
+                        next_run_time = self._next_daily_run(record.get('Trigger Time', ''), now)
+                        if next_run_time:
                             next_run = next_run_time.isoformat()
                     except Exception as e:
                         logger.error(f"Error calculating next run for daily reminder: {e}")
@@ -505,35 +896,17 @@ class SchedulerManager:
             Dictionary with reminder summary
         """
         try:
-            logger.info(f"Getting reminder summary for user: {user_id}")
-            
             worksheet = self._get_reminders_worksheet()
             if not worksheet:
                 logger.warning("Could not get reminders worksheet")
                 return self._empty_summary()
             
-            records = worksheet.get_all_records()
-            logger.info(f"Found {len(records)} total records in reminders sheet")
-            
             user_reminders = []
             
-            # Debug: Log all records to see what's in the sheet
-            for i, record in enumerate(records):
-                logger.info(f"Record {i}: User ID='{record.get('User ID')}', Company='{record.get('Company')}', Status='{record.get('Status')}'")
-                
-                # Normalize both user IDs for comparison (remove + sign and whitespace)
-                sheet_user_id = str(record.get('User ID', '')).strip().lstrip('+')
-                lookup_user_id = str(user_id).strip().lstrip('+')
-                
-                logger.info(f"Comparing: sheet_user_id='{sheet_user_id}' vs lookup_user_id='{lookup_user_id}'")
-                
-                # Filter reminders for this user that are pending
-                if (sheet_user_id == lookup_user_id and 
-                    str(record.get('Status', '')).strip().lower() == 'pending'):
+            # Filter reminders for this user that are pending
+            for _, record in self._get_user_reminder_records(worksheet, user_id):
+                if str(record.get('Status', '')).strip().lower() == 'pending':
                     user_reminders.append(record)
-                    logger.info(f"Matched reminder for user {user_id}: {record.get('Company')} - {record.get('Reminder Type')}")
-            
-            logger.info(f"Found {len(user_reminders)} reminders for user {user_id}")
             
             summary = {
                 'total_reminders': len(user_reminders),
@@ -544,12 +917,17 @@ class SchedulerManager:
             }
             
             next_run_times = []
+            now = datetime.now(_IST)
+            
+            # Per-reminder detail is only formatted when debug logging is on
+            debug = logger.isEnabledFor(logging.DEBUG)
             
             for reminder in user_reminders:
                 reminder_type = reminder.get('Reminder Type', '')
                 company = reminder.get('Company', 'Unknown')
                 
-                logger.info(f"Processing reminder: {company} - {reminder_type}")
+                if debug:
+                    logger.debug(f"Processing reminder: {company} - {reminder_type}")
                 
                 # Count by type
                 if reminder_type == 'daily':
@@ -563,22 +941,14 @@ class SchedulerManager:
                     try:
                         next_run = reminder.get('Trigger Time')
                         if next_run:
-                            next_run_times.append(datetime.fromisoformat(next_run))
-                    except:
+                            next_run_times.append(_parse_trigger_time(next_run))
+                    except ValueError:
+                        # Unparseable trigger: listed, but not a next-run candidate
                         pass
                 elif reminder_type == 'daily':
                     try:
-                        trigger_info = reminder.get('Trigger Time', '')
-                        if trigger_info.startswith('daily_'):
-                            time_part = trigger_info.replace('daily_', '')
-                            hour, minute = map(int, time_part.split(':'))
-                            
-                            now = datetime.now(pytz.timezone('Asia/Kolkata'))
-                            next_run_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                            
-                            if next_run_time <= now:
-                                next_run_time += timedelta(days=1)
-                            
+                        next_run_time = self._next_daily_run(reminder.get('Trigger Time', ''), now)
+                        if next_run_time:
                             next_run = next_run_time.isoformat()
                             next_run_times.append(next_run_time)
                     except Exception as e:
@@ -597,7 +967,10 @@ class SchedulerManager:
                 earliest = min(next_run_times)
                 summary['next_reminder'] = earliest.isoformat()
             
-            logger.info(f"Reminder summary for {user_id}: {summary}")
+            logger.info(
+                f"Reminder summary for {user_id}: total={summary['total_reminders']}, "
+                f"daily={summary['daily_reminders']}, applied={summary['applied_reminders']}"
+            )
             return summary
             
         except Exception as e:
@@ -628,27 +1001,24 @@ class SchedulerManager:
             if not worksheet:
                 return
             
-            records = worksheet.get_all_records()
             rescheduled_count = 0
+            new_trigger = f"daily_{new_hour:02d}:{new_minute:02d}"
+            updates = []
             
-            for i, record in enumerate(records):
-                # Normalize user IDs for comparison
-                sheet_user_id = str(record.get('User ID', '')).strip().lstrip('+')
-                lookup_user_id = str(user_id).strip().lstrip('+')
-                
-                if (sheet_user_id == lookup_user_id and 
-                    record.get('Reminder Type') == 'daily' and 
+            # Fresh read, since the row numbers are written to
+            for row_num, record in self._get_user_reminder_records(worksheet, user_id, fresh=True):
+                if (record.get('Reminder Type') == 'daily' and 
                     record.get('Status') == 'pending'):
-                    
-                    row_num = i + 2  # +2 for 1-indexing and headers
-                    
-                    # Update trigger time
-                    new_trigger = f"daily_{new_hour:02d}:{new_minute:02d}"
-                    try:
-                        worksheet.update(f'E{row_num}', new_trigger)  # Trigger Time column
-                        rescheduled_count += 1
-                    except Exception as e:
-                        logger.error(f"Error updating trigger time for row {row_num}: {e}")
+                    updates.append({'range': f'E{row_num}', 'values': [[new_trigger]]})  # Trigger Time column
+            
+            # Update every trigger time in one values.batchUpdate
+            if updates:
+                try:
+                    worksheet.batch_update(updates)
+                    rescheduled_count = len(updates)
+                except Exception as e:
+                    logger.error(f"Error updating trigger time for {len(updates)} reminders: {e}")
+                self._invalidate_records_cache()
             
             logger.info(f"Rescheduled {rescheduled_count} daily reminders for user {user_id} to {new_hour}:{new_minute:02d}")
             
@@ -9,12 +9,162 @@ Version: 1.1 (Fixed)
 """
 import os
 import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
-from twilio.base.exceptions import TwilioException
-from typing import Dict, Any, List, Union
+from twilio.base.exceptions import TwilioException, TwilioRestException
+from typing import Dict, Any, Iterable, List, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Responses that mean the message was not created, so a retry cannot send it
+# twice: rate limited (429) and service unavailable (503). Other 5xx errors
+# may come after Twilio accepted the message, and the Messages API takes no
+# idempotency key, so those are not retried.
+_RETRYABLE_STATUSES = frozenset({429, 503})
+
+# Backoff bounds for retrying those responses
+_RETRY_BASE_SECONDS = 0.5
+_RETRY_MAX_SECONDS = 8.0
+
+# Responses about the message itself (invalid number, bad content); Twilio
+# is working, so these do not count as outage failures
+_MESSAGE_ERROR_STATUSES = frozenset({400, 404})
+
+# International phone number: optional +, then 10-15 digits
+_PHONE_RE = re.compile(r'\+?\d{10,15}')
+
+# Room for job list rows in one WhatsApp message (bodies are capped at 1600
+# characters); the rest is left for the "more jobs" and total lines
+_JOB_LIST_MAX_CHARS = 1500
+
+# Emoji per lower-cased job status; anything else gets 📝
+_STATUS_EMOJI = {
+    'applied': '✅',
+    'not applied': '⏳',
+    'not eligible': '❌',
+    'not fixed': '🔄'
+}
+
+# Fixed headers of the formatted messages, underline included
+_STATS_HEADER = "📊 Your Job Application Stats\n" + "=" * 30 + "\n\n"
+_UPCOMING_HEADER = "📅 Upcoming Applications\n" + "=" * 25 + "\n\n"
+_REMINDERS_HEADER = "⏰ Your Reminders\n" + "=" * 18 + "\n\n"
+
+# The help text takes no arguments, so it is built once at import
+_HELP_MESSAGE = (
+    "🤖 WhatsApp Job Tracker Help\n"
+    + "=" * 30 + "\n\n"
+    "📝 Add/Update Jobs:\n"
+    "• Company Name (Date) - Status\n"
+    "• Amazon (15 Aug) - Applied\n"
+    "• Google - Not Applied\n\n"
+    "📋 Commands:\n"
+    "• Show Applied\n"
+    "• Show Not Applied\n"
+    "• Show Not Eligible\n"
+    "• Show Not Fixed\n"
+    "• Latest Status\n"
+    "• Upcoming Applications\n"
+    "• Delete [Company]\n"
+    "• Stats\n"
+    "• My Reminders\n"
+    "• Help\n\n"
+    "⏰ Statuses:\n"
+    "• Applied ✅ - Applied to the job\n"
+    "• Not Applied ⏳ - Haven't applied yet\n"
+    "• Not Eligible ❌ - Not eligible for role\n"
+    "• Not Fixed 🔄 - Status not determined\n\n"
+    "Need help? Just send 'Help' anytime!"
+)
+
+class _TokenBucket:
+    """Thread-safe token bucket that paces outbound Twilio requests"""
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize a full bucket
+        
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum tokens held (largest burst sent without waiting)
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            
+            # Reserve the token now; a negative balance is the queue of waiters
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
+
+class _CircuitBreaker:
+    """Fails sends fast while Twilio itself is failing, probing for recovery"""
+    
+    def __init__(self, fail_threshold: int, reset_after: float):
+        """
+        Initialize a closed breaker
+        
+        Args:
+            fail_threshold: Consecutive service failures that open the breaker
+            reset_after: Seconds to stay open before letting one probe through
+        """
+        self._fail_threshold = fail_threshold
+        self._reset_after = reset_after
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """
+        Check whether a send may go to Twilio
+        
+        Returns:
+            True while closed, and for a single probe once the open period ends
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self._reset_after:
+                return False
+            self._probing = True
+            return True
+    
+    def record_success(self):
+        """Close the breaker after Twilio answered normally"""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+    
+    def record_failure(self):
+        """Count a service failure, opening the breaker at the threshold or on a failed probe"""
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self._fail_threshold:
+                if self._opened_at is None or self._probing:
+                    logger.warning(f"Twilio failing, pausing sends for {self._reset_after:.0f}s")
+                self._opened_at = time.monotonic()
+                self._probing = False
+
 class TwilioBot:
     """Manages Twilio WhatsApp API interactions"""
     
@@ -30,9 +180,29 @@ class TwilioBot:
         self.auth_token = os.environ.get('TWILIO_AUTH_TOKEN')
         self.from_number = config['from_number']  # Format: whatsapp:+14155238886
         
-        # Initialize Twilio client
+        # Concurrent sends share one pace so bursts stay under Twilio's throughput limit
+        self._rate_limiter = _TokenBucket(
+            rate=config.get('rate_limit_per_second', 10),
+            capacity=config.get('rate_limit_burst', 20)
+        )
+        self._max_retries = config.get('max_retries', 3)
+        
+        # During a Twilio outage, sends fail at once instead of each waiting
+        # out its own timeouts and retries
+        self._circuit_breaker = _CircuitBreaker(
+            fail_threshold=config.get('circuit_fail_threshold', 10),
+            reset_after=config.get('circuit_reset_seconds', 30)
+        )
+        
+        # Initialize Twilio client. Its session keeps connections to the API
+        # alive, with room for every concurrent sender; retries are handled in
+        # _create_message so a request is never replayed underneath it.
         try:
-            self.client = Client(self.account_sid, self.auth_token)
+            http_client = TwilioHttpClient(pool_connections=True)
+            http_client.session.mount('https://', HTTPAdapter(
+                pool_connections=4, pool_maxsize=20, max_retries=0
+            ))
+            self.client = Client(self.account_sid, self.auth_token, http_client=http_client)
             logger.info("Twilio client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Twilio client: {e}")
@@ -49,30 +219,23 @@ class TwilioBot:
         Returns:
             Dictionary with success status and message info
         """
+        if not self._circuit_breaker.allow():
+            return {
+                'success': False,
+                'error': "Twilio unavailable: sending paused after repeated failures"
+            }
+        
         try:
-            # Convert to string if it's an integer
-            to_number_str = str(to_number)
-            
-            # Format the recipient number for WhatsApp
-            formatted_to = f"whatsapp:{to_number_str}" if not to_number_str.startswith('whatsapp:') else to_number_str
-            
-            # Ensure the number starts with + if it doesn't already
-            if not formatted_to.startswith('whatsapp:+'):
-                # Extract just the number part
-                number_part = formatted_to.replace('whatsapp:', '')
-                if not number_part.startswith('+'):
-                    formatted_to = f"whatsapp:+{number_part}"
-            
-            logger.info(f"Attempting to send message to {formatted_to}")
+            # Format the recipient as whatsapp:+<number>, whether or not it
+            # already has the prefix or the + (integers included)
+            number = str(to_number).removeprefix('whatsapp:')
+            formatted_to = f"whatsapp:+{number.removeprefix('+')}"
             
             # Send the message
-            message_obj = self.client.messages.create(
-                body=message,
-                from_=self.from_number,
-                to=formatted_to
-            )
+            message_obj = self._create_message(formatted_to, message)
+            self._circuit_breaker.record_success()
             
-            logger.info(f"Message sent successfully to {formatted_to}. SID: {message_obj.sid}")
+            logger.info("Message sent successfully to %s. SID: %s", formatted_to, message_obj.sid)
             
             return {
                 'success': True,
@@ -82,6 +245,12 @@ class TwilioBot:
             }
             
         except TwilioException as e:
+            # A rejected message (bad number, content) means Twilio is up;
+            # anything else counts towards opening the breaker
+            if getattr(e, 'status', None) in _MESSAGE_ERROR_STATUSES:
+                self._circuit_breaker.record_success()
+            else:
+                self._circuit_breaker.record_failure()
             logger.error(f"Twilio error sending message to {to_number}: {e}")
             return {
                 'success': False,
@@ -89,19 +258,53 @@ class TwilioBot:
                 'error_code': getattr(e, 'code', None)
             }
         except Exception as e:
+            self._circuit_breaker.record_failure()
             logger.error(f"Unexpected error sending message to {to_number}: {e}")
             return {
                 'success': False,
                 'error': f"Unexpected error: {str(e)}"
             }
     
-    def send_bulk_message(self, recipients: List[Union[str, int]], message: str) -> Dict[str, Any]:
+    def _create_message(self, formatted_to: str, message: str):
+        """
+        Create a Twilio message, retrying responses that did not create it
+        
+        Other errors (invalid number, auth, ambiguous 5xx) are raised on the
+        first attempt.
+        
+        Args:
+            formatted_to: Recipient in whatsapp:+<number> form
+            message: Message content to send
+            
+        Returns:
+            The created Twilio message instance
+        """
+        for attempt in range(self._max_retries + 1):
+            self._rate_limiter.acquire()
+            try:
+                return self.client.messages.create(
+                    body=message,
+                    from_=self.from_number,
+                    to=formatted_to
+                )
+            except TwilioRestException as e:
+                if attempt == self._max_retries or e.status not in _RETRYABLE_STATUSES:
+                    raise
+                
+                # Exponential backoff with full jitter
+                delay = random.uniform(0, min(_RETRY_MAX_SECONDS, _RETRY_BASE_SECONDS * 2 ** attempt))
+                logger.warning(f"Twilio returned {e.status} for {formatted_to}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def send_bulk_message(self, recipients: List[Union[str, int]], message: str,
+                          max_workers: int = 10) -> Dict[str, Any]:
         """
-        Send the same message to multiple recipients
+        Send the same message to multiple recipients concurrently
         
         Args:
             recipients: List of phone numbers (strings or integers)
             message: Message content to send
+            max_workers: Maximum number of concurrent Twilio requests
             
         Returns:
             Dictionary with results for each recipient
@@ -113,9 +316,12 @@ class TwilioBot:
             'total_failed': 0
         }
         
-        for recipient in recipients:
-            result = self.send_message(recipient, message)
-            
+        # Results come back in recipient order
+        sent = self.send_messages_batch(
+            [(recipient, message) for recipient in recipients], max_workers=max_workers
+        )
+        
+        for recipient, result in zip(recipients, sent):
             if result['success']:
                 results['successful'].append({
                     'number': str(recipient),
@@ -132,47 +338,81 @@ class TwilioBot:
         logger.info(f"Bulk message sent: {results['total_sent']} successful, {results['total_failed']} failed")
         return results
     
-    def format_job_list(self, jobs: List[Dict[str, Any]], title: str = "Job Applications") -> str:
+    def send_messages_batch(self, pairs: List[Tuple[Union[str, int], str]],
+                            max_workers: int = 10) -> List[Dict[str, Any]]:
+        """
+        Send a batch of (recipient, message) pairs concurrently
+        
+        Args:
+            pairs: List of (phone number, message) tuples
+            max_workers: Maximum number of concurrent Twilio requests
+            
+        Returns:
+            List of send_message results, in the same order as pairs
+        """
+        if not pairs:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as pool:
+            results = list(pool.map(lambda pair: self.send_message(*pair), pairs))
+        
+        sent = sum(1 for result in results if result['success'])
+        logger.info(f"Batch sent: {sent} successful, {len(results) - sent} failed")
+        return results
+    
+    def format_job_list(self, jobs: Iterable[Dict[str, Any]], title: str = "Job Applications") -> str:
         """
         Format a list of jobs for WhatsApp display
         
         Args:
-            jobs: List of job dictionaries
+            jobs: Iterable of job dictionaries (a list or a generator)
             title: Title for the list
             
         Returns:
             Formatted string suitable for WhatsApp
         """
-        if not jobs:
-            return f"📋 {title}\n\nNo jobs found."
-        
         # WhatsApp has a character limit, so we'll limit the display
         max_jobs = 20
         
-        formatted_message = f"📋 {title}\n{'=' * len(title)}\n\n"
+        parts = [f"📋 {title}\n{'=' * len(title)}\n\n"]
+        length = len(parts[0])
+        shown = 0
+        total = 0
         
-        for i, job in enumerate(jobs[:max_jobs]):
+        for job in jobs:
+            total += 1
+            if shown >= max_jobs:
+                # Keep counting so the total stays accurate
+                continue
+            
             company = job.get('Company Name', 'Unknown')
             status = job.get('Status', 'Unknown')
             app_date = job.get('Application Date', '')
             
             # Use emoji for status
             status_emoji = self._get_status_emoji(status)
+            date_part = f" ({app_date})" if app_date else ""
             
-            job_line = f"{i+1}. {status_emoji} {company}"
-            if app_date:
-                job_line += f" ({app_date})"
-            job_line += f" - {status}\n"
+            job_line = f"{shown + 1}. {status_emoji} {company}{date_part} - {status}\n"
+            if length + len(job_line) > _JOB_LIST_MAX_CHARS:
+                # No room for this row or any after it; they are only counted
+                max_jobs = shown
+                continue
             
-            formatted_message += job_line
+            parts.append(job_line)
+            length += len(job_line)
+            shown += 1
+        
+        if not total:
+            return f"📋 {title}\n\nNo jobs found."
         
         # Add truncation notice if needed
-        if len(jobs) > max_jobs:
-            formatted_message += f"\n... and {len(jobs) - max_jobs} more jobs.\n"
+        if total > shown:
+            parts.append(f"\n... and {total - shown} more jobs.\n")
         
-        formatted_message += f"\nTotal: {len(jobs)} jobs"
+        parts.append(f"\nTotal: {total} jobs")
         
-        return formatted_message
+        return "".join(parts)
     
     def format_stats_message(self, stats: Dict[str, Any]) -> str:
         """
@@ -184,26 +424,26 @@ class TwilioBot:
         Returns:
             Formatted statistics message
         """
-        message = "📊 Your Job Application Stats\n"
-        message += "=" * 30 + "\n\n"
-        
-        message += f"📈 Total Applications: {stats['total_applications']}\n\n"
-        
-        # Status breakdown
-        message += "📋 Status Breakdown:\n"
-        message += f"✅ Applied: {stats['applied']}\n"
-        message += f"⏳ Not Applied: {stats['not_applied']}\n"
-        message += f"❌ Not Eligible: {stats['not_eligible']}\n"
-        message += f"🔄 Not Fixed: {stats['not_fixed']}\n\n"
+        # Totals and status breakdown in one expression
+        message = (
+            _STATS_HEADER +
+            f"📈 Total Applications: {stats['total_applications']}\n\n"
+            "📋 Status Breakdown:\n"
+            f"✅ Applied: {stats['applied']}\n"
+            f"⏳ Not Applied: {stats['not_applied']}\n"
+            f"❌ Not Eligible: {stats['not_eligible']}\n"
+            f"🔄 Not Fixed: {stats['not_fixed']}\n\n"
+        )
         
         # Recent activity
         if stats['recent_activity']:
-            message += "🕒 Recent Activity:\n"
+            parts = [message, "🕒 Recent Activity:\n"]
             for job in stats['recent_activity'][-3:]:  # Show last 3
                 company = job.get('Company Name', 'Unknown')
                 status = job.get('Status', 'Unknown')
                 emoji = self._get_status_emoji(status)
-                message += f"{emoji} {company} - {status}\n"
+                parts.append(f"{emoji} {company} - {status}\n")
+            message = "".join(parts)
         
         return message
     
@@ -220,21 +460,18 @@ class TwilioBot:
         if not upcoming_jobs:
             return "📅 Upcoming Applications\n\nNo upcoming applications in the next 7 days."
         
-        message = "📅 Upcoming Applications\n"
-        message += "=" * 25 + "\n\n"
+        parts = [_UPCOMING_HEADER]
         
         for job in upcoming_jobs:
             company = job.get('Company Name', 'Unknown')
             app_date = job.get('Application Date', '')
             status = job.get('Status', 'Unknown')
             emoji = self._get_status_emoji(status)
+            due_line = f"   📅 Due: {app_date}\n" if app_date else ""
             
-            message += f"{emoji} {company}\n"
-            if app_date:
-                message += f"   📅 Due: {app_date}\n"
-            message += f"   Status: {status}\n\n"
+            parts.append(f"{emoji} {company}\n{due_line}   Status: {status}\n\n")
         
-        return message
+        return "".join(parts)
     
     def format_reminder_summary(self, summary: Dict[str, Any]) -> str:
         """
@@ -246,30 +483,30 @@ class TwilioBot:
         Returns:
             Formatted message
         """
-        message = "⏰ Your Reminders\n"
-        message += "=" * 18 + "\n\n"
-        
-        message += f"📊 Total Reminders: {summary['total_reminders']}\n"
-        message += f"🔄 Daily Reminders: {summary['daily_reminders']}\n"
-        message += f"📅 Application Reminders: {summary['applied_reminders']}\n\n"
+        parts = [
+            _REMINDERS_HEADER +
+            f"📊 Total Reminders: {summary['total_reminders']}\n"
+            f"🔄 Daily Reminders: {summary['daily_reminders']}\n"
+            f"📅 Application Reminders: {summary['applied_reminders']}\n\n"
+        ]
         
         if summary['next_reminder']:
             try:
-                from datetime import datetime
-                next_time = datetime.fromisoformat(summary['next_reminder'].replace('Z', '+00:00'))
-                message += f"⏰ Next Reminder: {next_time.strftime('%d %b %Y at %I:%M %p')}\n\n"
-            except:
-                message += f"⏰ Next Reminder: {summary['next_reminder']}\n\n"
+                # fromisoformat reads a trailing Z itself (Python 3.11+)
+                next_time = datetime.fromisoformat(summary['next_reminder'])
+                parts.append(f"⏰ Next Reminder: {next_time.strftime('%d %b %Y at %I:%M %p')}\n\n")
+            except ValueError:
+                parts.append(f"⏰ Next Reminder: {summary['next_reminder']}\n\n")
         
         if summary['companies_with_reminders']:
-            message += "🏢 Companies with Reminders:\n"
+            parts.append("🏢 Companies with Reminders:\n")
             for reminder in summary['companies_with_reminders'][:10]:  # Limit to 10
                 company = reminder['company']
                 reminder_type = reminder['type']
                 type_emoji = "🔄" if reminder_type == "daily" else "📅"
-                message += f"{type_emoji} {company} ({reminder_type})\n"
+                parts.append(f"{type_emoji} {company} ({reminder_type})\n")
         
-        return message
+        return "".join(parts)
     
     def _get_status_emoji(self, status: str) -> str:
         """
@@ -281,16 +518,7 @@ class TwilioBot:
         Returns:
             Appropriate emoji
         """
-        status_lower = status.lower()
-        
-        emoji_map = {
-            'applied': '✅',
-            'not applied': '⏳',
-            'not eligible': '❌',
-            'not fixed': '🔄'
-        }
-        
-        return emoji_map.get(status_lower, '📝')
+        return _STATUS_EMOJI.get(status.lower(), '📝')
     
     def format_help_message(self) -> str:
         """
@@ -299,35 +527,7 @@ class TwilioBot:
         Returns:
             Formatted help message
         """
-        message = "🤖 WhatsApp Job Tracker Help\n"
-        message += "=" * 30 + "\n\n"
-        
-        message += "📝 Add/Update Jobs:\n"
-        message += "• Company Name (Date) - Status\n"
-        message += "• Amazon (15 Aug) - Applied\n"
-        message += "• Google - Not Applied\n\n"
-        
-        message += "📋 Commands:\n"
-        message += "• Show Applied\n"
-        message += "• Show Not Applied\n"
-        message += "• Show Not Eligible\n"
-        message += "• Show Not Fixed\n"
-        message += "• Latest Status\n"
-        message += "• Upcoming Applications\n"
-        message += "• Delete [Company]\n"
-        message += "• Stats\n"
-        message += "• My Reminders\n"
-        message += "• Help\n\n"
-        
-        message += "⏰ Statuses:\n"
-        message += "• Applied ✅ - Applied to the job\n"
-        message += "• Not Applied ⏳ - Haven't applied yet\n"
-        message += "• Not Eligible ❌ - Not eligible for role\n"
-        message += "• Not Fixed 🔄 - Status not determined\n\n"
-        
-        message += "Need help? Just send 'Help' anytime!"
-        
-        return message
+        return _HELP_MESSAGE
     
     def format_error_message(self, error: str) -> str:
         """
@@ -380,24 +580,6 @@ class TwilioBot:
         Returns:
             True if format appears valid
         """
-        # Convert to string first
-        phone_str = str(phone_number)
-        
-        # Remove whatsapp: prefix if present
-        number = phone_str.replace('whatsapp:', '')
-        
-        # Basic validation - should start with + and contain only digits and +
-        if not number.startswith('+'):
-            # If it doesn't start with +, assume it's a valid number and add +
-            number = f"+{number}"
-        
-        # Remove + and check if remaining characters are digits
-        digits_only = number[1:]
-        if not digits_only.isdigit():
-            return False
-        
-        # Should be between 10-15 digits (international standard)
-        if len(digits_only) < 10 or len(digits_only) > 15:
-            return False
-        
-        return True
+        # Remove whatsapp: prefix if present; the + is optional
+        number = str(phone_number).removeprefix('whatsapp:')
+        return _PHONE_RE.fullmatch(number) is not None